@@ -0,0 +1,54 @@
+"""
+Codenames AI Game - Translation Builder
+Pre-translates the WORD_POOL into every GUI language and writes translations.json.
+The file is not shipped with the game; once generated, the GUI shows board
+translations from it and only looks up other words (such as clues) online.
+
+Usage: python build_translations.py
+Requires requests (MyMemory API) or googletrans (pip install requests).
+"""
+
+import json
+import os
+import sys
+
+from codenames import WORD_POOL
+from translation import COMMON_LANGUAGES, STATIC_TRANSLATIONS_FILE, create_translator
+
+
+def build_translations(path: str = STATIC_TRANSLATIONS_FILE):
+    """Translate WORD_POOL into each language and save the result as {lang: {word: translated}}."""
+    translator = create_translator()
+
+    # Keep what an earlier (possibly interrupted) run already produced
+    translations = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            translations = json.load(f)
+
+    for name, lang in COMMON_LANGUAGES.items():
+        words = translations.setdefault(lang, {})
+        needed = [w for w in WORD_POOL if w not in words]
+        if not needed:
+            continue
+        print(f"Translating {len(needed)} words to {name} ({lang})...")
+        try:
+            results = translator.translate(needed, dest=lang)
+        except Exception as e:
+            print(f"  Failed: {e}")
+            continue
+        for word, result in zip(needed, results):
+            if result and result.text:
+                words[word] = result.text
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(translations, f, ensure_ascii=False, indent=1, sort_keys=True)
+    print(f"Wrote {sum(len(w) for w in translations.values())} translations to {path}")
+
+
+if __name__ == "__main__":
+    try:
+        build_translations()
+    except ImportError:
+        print("This script requires 'requests' or 'googletrans': pip install requests")
+        sys.exit(1)
@@ -3,13 +3,17 @@ Codenames AI Game
 A micro Python implementation of the famous board game Codenames with AI players.
 """
 
+import copy
+import functools
+import heapq
 import random
 import sys
 import time
-from typing import List, Tuple, Optional
+from collections import Counter
+from typing import Dict, List, Tuple, Optional
 
-# Word pool for the game
-WORD_POOL = [
+# Word pool for the game (immutable; sampled once per board setup)
+WORD_POOL = (
     "APPLE", "BALL", "BANK", "BEACH", "BEAR", "BED", "BOOK", "BOTTLE", "BRIDGE",
     "BROTHER", "CAT", "CHINA", "CHURCH", "CIRCLE", "CLOUD", "CODE", "COOK", "CROSS",
     "CROWN", "DANCE", "DIAMOND", "DOCTOR", "DRAGON", "DRESS", "DRILL", "DROP", "DUCK",
@@ -46,58 +50,93 @@ WORD_POOL = [
     "UNICORN", "VACUUM", "VAN", "VET", "WAKE", "WALL", "WAR", "WASHER", "WASHINGTON",
     "WATCH", "WATER", "WAVE", "WEB", "WELL", "WHALE", "WHIP", "WIND", "WITCH",
     "WIZARD", "WOLF", "WOOD", "WOOL", "WORLD", "WORM", "YARD"
-]
+)
+
+# Board dimensions
+_BOARD_SIZE = 5
+_BOARD_SIZE_SQ = _BOARD_SIZE * _BOARD_SIZE
+
+# Card types a word can be assigned to
+_CARD_TYPES = ('RED', 'BLUE', 'NEUTRAL', 'ASSASSIN')
+
+# Unshuffled card decks keyed by starting team (the starting team holds 9 cards)
+_CARD_DECKS = {
+    'RED': ('RED',) * 9 + ('BLUE',) * 8 + ('NEUTRAL',) * 7 + ('ASSASSIN',),
+    'BLUE': ('RED',) * 8 + ('BLUE',) * 9 + ('NEUTRAL',) * 7 + ('ASSASSIN',),
+}
+
+# Opposing team lookup used to flip turns
+_OTHER_TEAM = {'RED': 'BLUE', 'BLUE': 'RED'}
+
+
+# Board symbols shown for each card type
+_SYMBOLS = {'RED': '[R]', 'BLUE': '[B]', 'NEUTRAL': '[N]', 'ASSASSIN': '[X]'}
+_HIDDEN = ' ? '
+
+
+def _charmask(text: str) -> int:
+    """Bitmask of the distinct characters in text (bit n is set for ord(c) == n)."""
+    mask = 0
+    for c in text:
+        mask |= 1 << ord(c)
+    return mask
 
 
 class CodenamesGame:
     """Main game class for Codenames AI."""
     
-    def __init__(self):
-        self.board_size = 5
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)  # Per-game RNG; pass a seed for reproducible boards
+        self.board_size = _BOARD_SIZE
         self.words = []
+        self.word_set = frozenset()  # Board words, for O(1) membership tests
         self.board = []  # 5x5 grid
         self.card_types = []  # 'RED', 'BLUE', 'NEUTRAL', 'ASSASSIN'
         self.revealed = []  # Which cards have been revealed
+        self.unrevealed = {}  # Complement of revealed: word -> board index, in board order
+        # Unrevealed words per card type, kept in board order (dicts used as ordered sets)
+        self.unrevealed_by_team = {t: {} for t in _CARD_TYPES}
+        self.words_lower = []  # Lowercase forms, parallel to self.words
+        self._word_masks = []  # Per-word character bitmasks, parallel to self.words
+        self._word_display = []  # Per-word 3-char board labels, parallel to self.words
         self.turn = 'RED'  # RED starts
-        self.red_remaining = 9
-        self.blue_remaining = 8
+        # Unrevealed card count per card type
+        self.remaining = {'RED': 9, 'BLUE': 8, 'NEUTRAL': 7, 'ASSASSIN': 1}
         self.game_over = False
         self.winner = None
 
     def setup_board(self):
         """Initialize the game board with random words and card assignments."""
         # Select 25 random words
-        self.words = random.sample(WORD_POOL, self.board_size ** 2)
+        self.words = self._rng.sample(WORD_POOL, _BOARD_SIZE_SQ)
+        self.word_set = frozenset(self.words)
         
         # Create board structure
         self.board = [[self.words[i * self.board_size + j] 
                       for j in range(self.board_size)]
                      for i in range(self.board_size)]
         
-        # Assign card types: 9 RED, 8 BLUE, 7 NEUTRAL, 1 ASSASSIN
-        card_assignments = (['RED'] * 9 + ['BLUE'] * 8 + 
-                           ['NEUTRAL'] * 7 + ['ASSASSIN'] * 1)
-        random.shuffle(card_assignments)
-        self.card_types = {}
-        
-        # Random starting team
-        first_team = random.choice(['RED', 'BLUE'])
-        if first_team == 'RED':
-            card_assignments = (['RED'] * 9 + ['BLUE'] * 8 + 
-                               ['NEUTRAL'] * 7 + ['ASSASSIN'] * 1)
-        else:
-            card_assignments = (['RED'] * 8 + ['BLUE'] * 9 + 
-                               ['NEUTRAL'] * 7 + ['ASSASSIN'] * 1)
-        random.shuffle(card_assignments)
-        
-        for idx, word in enumerate(self.words):
-            self.card_types[word] = card_assignments[idx]
-        
-        # Count remaining cards
-        self.red_remaining = sum(1 for ct in card_assignments if ct == 'RED')
-        self.blue_remaining = sum(1 for ct in card_assignments if ct == 'BLUE')
-        
+        # Random starting team; the starting team always holds 9 cards, the other 8
+        first_team = 'RED' if self._rng.random() < 0.5 else 'BLUE'
+        red, blue = (9, 8) if first_team == 'RED' else (8, 9)
+        self.remaining = {'RED': red, 'BLUE': blue, 'NEUTRAL': 7, 'ASSASSIN': 1}
+
+        # Assign card types: 9/8 RED/BLUE, 7 NEUTRAL, 1 ASSASSIN
+        card_assignments = list(_CARD_DECKS[first_team])
+        self._rng.shuffle(card_assignments)
+        self.card_types = dict(zip(self.words, card_assignments))
+
+        self.unrevealed_by_team = {t: {} for t in _CARD_TYPES}
+        for word, card_type in self.card_types.items():
+            self.unrevealed_by_team[card_type][word] = None
+
+        # Precompute per-word features used by AIGuesser scoring
+        self.words_lower = [w.lower() for w in self.words]
+        self._word_masks = [_charmask(w) for w in self.words_lower]
+        self._word_display = [f"{w[:3]:3}" for w in self.words]
+
         self.revealed = set()
+        self.unrevealed = {w: idx for idx, w in enumerate(self.words)}
         self.turn = first_team
         self.game_over = False
         self.winner = None
@@ -111,67 +150,244 @@ class CodenamesGame:
         Reveal a card and return (success, card_type).
         success is False if word not found or already revealed.
         """
-        if word not in self.words or word in self.revealed:
+        if word not in self.word_set or word in self.revealed:
             return False, None
         
         self.revealed.add(word)
+        self.unrevealed.pop(word, None)
         card_type = self.get_card_type(word)
-        
-        if card_type == 'RED':
-            self.red_remaining -= 1
-        elif card_type == 'BLUE':
-            self.blue_remaining -= 1
+        self.unrevealed_by_team[card_type].pop(word, None)
+        self.remaining[card_type] -= 1
         
         return True, card_type
     
+    @property
+    def red_remaining(self) -> int:
+        """Unrevealed RED cards."""
+        return self.remaining['RED']
+    
+    @property
+    def blue_remaining(self) -> int:
+        """Unrevealed BLUE cards."""
+        return self.remaining['BLUE']
+    
+    def switch_turn(self) -> str:
+        """Hand the turn to the other team and return the new team."""
+        self.turn = _OTHER_TEAM[self.turn]
+        return self.turn
+    
+    def snapshot(self) -> 'CodenamesGame':
+        """
+        Copy of the game that later moves do not change, for reading on
+        another thread. The board itself is shared; only the state that
+        reveal_card updates is copied.
+        """
+        snap = copy.copy(self)
+        snap.revealed = set(self.revealed)
+        snap.unrevealed = dict(self.unrevealed)
+        snap.unrevealed_by_team = {t: dict(words) for t, words in self.unrevealed_by_team.items()}
+        snap.remaining = dict(self.remaining)
+        return snap
+    
     def check_win_condition(self) -> Optional[str]:
         """Check if game is over and return winner, or None."""
-        if self.red_remaining == 0:
+        if self.remaining['RED'] == 0:
             return 'RED'
-        if self.blue_remaining == 0:
+        if self.remaining['BLUE'] == 0:
             return 'BLUE'
         return None
     
     def display_board(self, show_all=False):
         """Display the game board."""
-        print("\n" + "=" * 70)
-        print(f"CODENAMES BOARD - Turn: {self.turn}")
-        print(f"Red remaining: {self.red_remaining} | Blue remaining: {self.blue_remaining}")
-        print("=" * 70 + "\n")
-        
-        # Header
-        print("   ", end="")
-        for j in range(self.board_size):
-            print(f" {j+1:2} ", end="")
-        print()
-        
-        # Board rows
-        for i in range(self.board_size):
-            print(f"{chr(65+i)}  ", end="")  # A, B, C, D, E
-            for j in range(self.board_size):
-                word = self.board[i][j]
-                if show_all:
-                    # Show card types
-                    card_type = self.get_card_type(word)
-                    symbols = {'RED': '[R]', 'BLUE': '[B]', 'NEUTRAL': '[N]', 'ASSASSIN': '[X]'}
-                    symbol = symbols.get(card_type, '[?]')
-                    print(f"{symbol}{word[:3]:3}", end=" ")
-                elif word in self.revealed:
-                    card_type = self.get_card_type(word)
-                    symbols = {'RED': '[R]', 'BLUE': '[B]', 'NEUTRAL': '[N]', 'ASSASSIN': '[X]'}
-                    symbol = symbols.get(card_type, '[?]')
-                    print(f"{symbol}{word[:3]:3}", end=" ")
+        n = self.board_size
+        lines = [
+            "",
+            "=" * 70,
+            f"CODENAMES BOARD - Turn: {self.turn}",
+            f"Red remaining: {self.red_remaining} | Blue remaining: {self.blue_remaining}",
+            "=" * 70,
+            "",
+            "   " + "".join(f" {j+1:2} " for j in range(n)),  # Header
+        ]
+        
+        # Board rows: A, B, C, D, E
+        for i in range(n):
+            cells = []
+            for idx in range(i * n, (i + 1) * n):
+                word = self.words[idx]
+                if show_all or word in self.revealed:
+                    symbol = _SYMBOLS.get(self.card_types[word], '[?]')
                 else:
-                    print(f" ? {word[:3]:3}", end=" ")
-            print()
-        print()
+                    symbol = _HIDDEN
+                cells.append(f"{symbol}{self._word_display[idx]} ")
+            lines.append(f"{chr(65+i)}  " + "".join(cells))
+        lines.append("")
+        
+        # Emit the whole display with a single write
+        print("\n".join(lines))
+
+
+# Simple associations used by the spymaster (micro version - expandable)
+_ASSOCIATIONS = {
+    'animal': ('cat', 'dog', 'bear', 'tiger', 'lion', 'elephant', 'rabbit'),
+    'body': ('hand', 'head', 'eye', 'foot', 'face', 'heart'),
+    'nature': ('tree', 'forest', 'river', 'mountain', 'ocean', 'beach'),
+    'building': ('house', 'school', 'hospital', 'bank', 'hotel', 'church'),
+    'color': ('red', 'blue', 'green', 'yellow', 'black', 'white'),
+    'food': ('apple', 'bread', 'cake', 'cheese', 'meat'),
+    'sport': ('ball', 'game', 'player', 'team', 'field'),
+    'water': ('water', 'ocean', 'river', 'lake', 'beach', 'fish'),
+    'royal': ('king', 'queen', 'crown', 'royal', 'prince'),
+    'war': ('soldier', 'war', 'gun', 'battle', 'army'),
+    'space': ('moon', 'star', 'planet', 'space', 'rocket'),
+    'music': ('song', 'music', 'piano', 'note', 'sound'),
+    'time': ('clock', 'time', 'hour', 'minute', 'day'),
+    'round': ('ball', 'circle', 'ring', 'round', 'wheel'),
+    'sharp': ('knife', 'sword', 'needle', 'point', 'blade'),
+}
+
+
+def _build_word_index(associations) -> dict:
+    """Map each word to its (category, other_words) pairs, in category order."""
+    index = {}
+    for category, words in associations.items():
+        for word in words:
+            others = tuple(w for w in words if w != word)
+            index.setdefault(word, []).append((category, others))
+    return {word: tuple(hits) for word, hits in index.items()}
+
+
+_WORD_TO_CATEGORIES = _build_word_index(_ASSOCIATIONS)
+
+
+def _index_categories(associations) -> dict:
+    """Map each word to the tuple of categories that contain it."""
+    index = {}
+    for category, words in associations.items():
+        for word in words:
+            index.setdefault(word, []).append(category)
+    return {word: tuple(categories) for word, categories in index.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _potential_clues(word: str) -> Tuple[str, ...]:
+    """Potential clues for a board word (cached; board words come from WORD_POOL)."""
+    word_lower = word.lower()
+
+    potential = []
+    for category, others in _WORD_TO_CATEGORIES.get(word_lower, ()):
+        # Use category name or related words
+        potential.append(category)
+        potential.extend(others)
+
+    # Add some generic clues based on word characteristics
+    if len(word) > 4:
+        potential.append(word[:4] + "ING")  # Simple transform
+    if 'er' in word_lower:
+        potential.append(word_lower.replace('er', ''))
+
+    return tuple(potential[:5])  # Limit to top 5
+
+
+# Optional word embeddings (pip install sentence-transformers)
+_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Candidate clue vocabulary for the embedding spymaster
+_CLUE_VOCAB = tuple(sorted(
+    {w.lower() for w in WORD_POOL} | set(_ASSOCIATIONS) |
+    {w for words in _ASSOCIATIONS.values() for w in words}
+))
+
+# Clue scoring weights: reward team similarity, penalise the closest bad card
+_LAMBDA_TEAM = 1.0
+_LAMBDA_RISK = 0.5
+
+# The embedding guesser passes when no card is at least this similar to the
+# clue (unrelated MiniLM word pairs still score around 0.1-0.2)
+_GUESS_MIN_SIM = 0.3
+
+
+class WordEmbeddings:
+    """
+    Unit-length word vectors from a small sentence-transformers model.
+    Every word is encoded once and kept in one matrix, so similarity is a
+    cosine lookup (a single matrix product).
+    With quantize=True (default) vectors are stored as int8 with a float32
+    scale per row (4x smaller than float32); dot products accumulate in int32.
+    """
+    
+    def __init__(self, model_name: str = _EMBEDDING_MODEL, quantize: bool = True):
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+        
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self._quantize = quantize
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=np.int8 if quantize else np.float32)
+        self._scales = np.zeros(0, dtype=np.float32)  # Per-row int8 scale (quantize only)
+        
+        # Precompute the fixed vocabulary (board words and clue candidates)
+        self.add(_CLUE_VOCAB)
+    
+    def add(self, words) -> None:
+        """Encode any words not seen yet, in a single batch."""
+        np = self._np
+        missing = [w for w in dict.fromkeys(words) if w not in self._rows]
+        if not missing:
+            return
+        
+        new = np.asarray(self._model.encode(missing, normalize_embeddings=True),
+                         dtype=np.float32)
+        if self._quantize:
+            # Symmetric per-row quantization: v ~= q * scale, q in [-127, 127]
+            scales = np.abs(new).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            new = np.round(new / scales[:, None]).astype(np.int8)
+            self._scales = np.concatenate((self._scales, scales.astype(np.float32)))
+        
+        start = len(self._rows)
+        for offset, word in enumerate(missing):
+            self._rows[word] = start + offset
+        self._vectors = new if start == 0 else np.vstack((self._vectors, new))
+    
+    def similarity_matrix(self, words: List[str], others: List[str]):
+        """Cosine similarities, shape (len(words), len(others))."""
+        self.add(words)
+        self.add(others)
+        row_idx = [self._rows[w] for w in words]
+        col_idx = [self._rows[w] for w in others]
+        rows = self._vectors[row_idx]
+        cols = self._vectors[col_idx]
+        if not self._quantize:
+            return rows @ cols.T
+        
+        np = self._np
+        dots = rows.astype(np.int32) @ cols.astype(np.int32).T
+        return dots * np.outer(self._scales[row_idx], self._scales[col_idx])
+
+
+@functools.lru_cache(maxsize=None)
+def load_embeddings(model_name: str = _EMBEDDING_MODEL) -> Optional[WordEmbeddings]:
+    """
+    Load the shared embedding model once.
+    Returns None if sentence-transformers is not installed or fails to load.
+    """
+    try:
+        return WordEmbeddings(model_name)
+    except ImportError:
+        return None
+    except Exception as e:
+        print(f"Embedding model unavailable ({e}); using simple word associations.")
+        return None
 
 
 class AISpymaster:
     """AI that generates clues for the team."""
     
-    def __init__(self, team: str):
+    def __init__(self, team: str, embeddings: Optional[WordEmbeddings] = None):
         self.team = team
+        self.embeddings = embeddings  # Use embedding similarity when provided
         
     def generate_clue(self, game: CodenamesGame) -> Tuple[str, int]:
         """
@@ -179,14 +395,14 @@ class AISpymaster:
         Returns (clue_word, number_of_associated_words)
         """
         # Get unrevealed cards for this team
-        team_words = []
-        for word in game.words:
-            if word not in game.revealed and game.get_card_type(word) == self.team:
-                team_words.append(word)
+        team_words = list(game.unrevealed_by_team[self.team])
         
         if not team_words:
             return ("PASS", 0)
         
+        if self.embeddings is not None:
+            return self._embedding_clue(game, team_words)
+        
         # Simple strategy: look for words that could connect team words
         # Find common themes or associations
         clue_scores = {}
@@ -206,7 +422,7 @@ class AISpymaster:
         
         for clue, associated_words in clue_scores.items():
             # Make sure clue isn't on the board
-            if clue.upper() not in game.words:
+            if clue.upper() not in game.word_set:
                 unique_words = len(set(associated_words))
                 if unique_words > best_count and unique_words <= len(team_words):
                     best_count = unique_words
@@ -223,50 +439,68 @@ class AISpymaster:
     
     def _get_potential_clues(self, word: str) -> List[str]:
         """Generate potential clue words based on a target word."""
-        word_lower = word.lower()
-        
-        # Simple associations (micro version - expandable)
-        associations = {
-            'animal': ['cat', 'dog', 'bear', 'tiger', 'lion', 'elephant', 'rabbit'],
-            'body': ['hand', 'head', 'eye', 'foot', 'face', 'heart'],
-            'nature': ['tree', 'forest', 'river', 'mountain', 'ocean', 'beach'],
-            'building': ['house', 'school', 'hospital', 'bank', 'hotel', 'church'],
-            'color': ['red', 'blue', 'green', 'yellow', 'black', 'white'],
-            'food': ['apple', 'bread', 'cake', 'cheese', 'meat'],
-            'sport': ['ball', 'game', 'player', 'team', 'field'],
-            'water': ['water', 'ocean', 'river', 'lake', 'beach', 'fish'],
-            'royal': ['king', 'queen', 'crown', 'royal', 'prince'],
-            'war': ['soldier', 'war', 'gun', 'battle', 'army'],
-            'space': ['moon', 'star', 'planet', 'space', 'rocket'],
-            'music': ['song', 'music', 'piano', 'note', 'sound'],
-            'time': ['clock', 'time', 'hour', 'minute', 'day'],
-            'round': ['ball', 'circle', 'ring', 'round', 'wheel'],
-            'sharp': ['knife', 'sword', 'needle', 'point', 'blade']
-        }
-        
-        potential = []
-        for category, words in associations.items():
-            if word_lower in words:
-                # Use category name or related words
-                potential.append(category)
-                potential.extend([w for w in words if w != word_lower])
-        
-        # Add some generic clues based on word characteristics
-        if len(word) > 4:
-            potential.append(word[:4] + "ING")  # Simple transform
-        if 'er' in word_lower:
-            potential.append(word_lower.replace('er', ''))
-        
-        return potential[:5]  # Limit to top 5
+        return list(_potential_clues(word))
+    
+    def _embedding_clue(self, game: CodenamesGame, team_words: List[str]) -> Tuple[str, int]:
+        """
+        Pick the clue maximising
+        _LAMBDA_TEAM * sum(sim to targeted team words) - _LAMBDA_RISK * max(sim to other cards),
+        where the targeted team words are those closer to the clue than any other card.
+        """
+        np = self.embeddings._np
+        board_lower = game.words_lower
+        
+        # Clues may not be a board word or part of one (or contain one)
+        candidates = [c for c in _CLUE_VOCAB
+                      if not any(c in b or b in c for b in board_lower)]
+        if not candidates:
+            return (team_words[0], 1)
+        
+        team_lower = [board_lower[game.unrevealed[w]] for w in team_words]
+        bad_lower = [board_lower[idx] for w, idx in game.unrevealed.items()
+                     if game.card_types[w] != self.team]
+        
+        sims = self.embeddings.similarity_matrix(candidates, team_lower + bad_lower)
+        team_sims = sims[:, :len(team_lower)]
+        if bad_lower:
+            bad_max = sims[:, len(team_lower):].max(axis=1)
+        else:
+            bad_max = np.full(len(candidates), -1.0, dtype=np.float32)
+        
+        targeted = team_sims > bad_max[:, None]
+        counts = targeted.sum(axis=1)
+        scores = (_LAMBDA_TEAM * (team_sims * targeted).sum(axis=1)
+                  - _LAMBDA_RISK * bad_max)
+        scores[counts == 0] = -np.inf
+        
+        best = int(scores.argmax())
+        if counts[best] == 0:
+            return (team_words[0], 1)
+        return (candidates[best].upper(), int(counts[best]))
 
 
 class AIGuesser:
     """AI that makes guesses based on clues."""
     
-    def __init__(self, team: str):
+    # Semantic associations (simple keyword matching)
+    _ASSOCIATIONS = {
+        'animal': frozenset(('cat', 'dog', 'bear', 'tiger', 'lion', 'elephant')),
+        'body': frozenset(('hand', 'head', 'eye', 'foot', 'face')),
+        'nature': frozenset(('tree', 'forest', 'river', 'mountain')),
+        'water': frozenset(('water', 'ocean', 'river', 'beach', 'fish')),
+        'royal': frozenset(('king', 'queen', 'crown', 'royal')),
+        'round': frozenset(('ball', 'circle', 'ring', 'wheel')),
+    }
+    _WORD_CATS = _index_categories(_ASSOCIATIONS)
+    
+    def __init__(self, team: str, embeddings: Optional[WordEmbeddings] = None):
         self.team = team
+        self.embeddings = embeddings  # Use embedding similarity when provided
         self.recent_clue = None
         self.recent_count = 0
+        # Ranked candidates for the last scored clue, reused across its guesses
+        self._ranked_key = None  # (board words list, lowercase clue)
+        self._ranked: List[str] = []
         
     def make_guess(self, game: CodenamesGame, clue: str, count: int) -> Optional[str]:
         """
@@ -279,33 +513,55 @@ class AIGuesser:
         if clue == "PASS" or count == 0:
             return None
         
-        # Get unrevealed words
-        available = [w for w in game.words if w not in game.revealed]
+        # Unrevealed words (word -> board index), maintained by the game
+        available = game.unrevealed
         
         if not available:
             return None
         
-        # Score words based on relevance to clue
-        scores = {}
         clue_lower = clue.lower()
-        
-        for word in available:
-            score = self._score_word(clue_lower, word.lower())
-            scores[word] = score
-        
-        # Sort by score
-        sorted_words = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        # Make best guess (top scoring word)
-        if sorted_words:
-            best_word, best_score = sorted_words[0]
-            if best_score > 0:  # Only guess if there's some relevance
-                return best_word
-        
-        return None
+        if self.embeddings is not None:
+            return self._embedding_guess(game, clue_lower)
+        
+        # Word scores depend only on the clue, so the ranking from an earlier
+        # guess on this clue stays valid; take its best still-unrevealed word
+        key = self._ranked_key
+        if key is not None and key[0] is game.words and key[1] == clue_lower:
+            for word in self._ranked:
+                if word in available:
+                    return word
+        
+        self._ranked = self._rank_words(game, clue_lower, count + 1)
+        self._ranked_key = (game.words, clue_lower)
+        return self._ranked[0] if self._ranked else None
+    
+    def _rank_words(self, game: CodenamesGame, clue: str, k: int) -> List[str]:
+        """
+        Top-k unrevealed words by score for the clue, best first.
+        Ties keep board order; words with no relevance (score 0) are dropped.
+        """
+        clue_mask = _charmask(clue)
+        scored = ((word, self._score_word(clue, game.words_lower[idx],
+                                          clue_mask, game._word_masks[idx]))
+                  for word, idx in game.unrevealed.items())
+        top = heapq.nlargest(k, ((w, s) for w, s in scored if s > 0), key=lambda x: x[1])
+        return [word for word, _ in top]
     
-    def _score_word(self, clue: str, word: str) -> float:
-        """Score how well a word matches a clue."""
+    def _embedding_guess(self, game: CodenamesGame, clue: str) -> Optional[str]:
+        """Guess the unrevealed word with the highest cosine similarity to the clue."""
+        words = list(game.unrevealed)
+        sims = self.embeddings.similarity_matrix(
+            [clue], [game.words_lower[idx] for idx in game.unrevealed.values()])[0]
+        best = int(sims.argmax())
+        return words[best] if sims[best] >= _GUESS_MIN_SIM else None
+    
+    def _score_word(self, clue: str, word: str,
+                    clue_mask: Optional[int] = None,
+                    word_mask: Optional[int] = None) -> float:
+        """
+        Score how well a word matches a clue.
+        clue_mask/word_mask may be passed in precomputed (see _charmask).
+        """
         score = 0.0
         
         # Exact match
@@ -317,9 +573,11 @@ class AIGuesser:
             score += 30.0
         
         # Character overlap
-        clue_chars = set(clue)
-        word_chars = set(word)
-        overlap = len(clue_chars & word_chars)
+        if clue_mask is None:
+            clue_mask = _charmask(clue)
+        if word_mask is None:
+            word_mask = _charmask(word)
+        overlap = (clue_mask & word_mask).bit_count()
         score += overlap * 5.0
         
         # Length similarity
@@ -327,19 +585,10 @@ class AIGuesser:
         score += max(0, 10 - length_diff)
         
         # Semantic associations (simple keyword matching)
-        associations = {
-            'animal': ['cat', 'dog', 'bear', 'tiger', 'lion', 'elephant'],
-            'body': ['hand', 'head', 'eye', 'foot', 'face'],
-            'nature': ['tree', 'forest', 'river', 'mountain'],
-            'water': ['water', 'ocean', 'river', 'beach', 'fish'],
-            'royal': ['king', 'queen', 'crown', 'royal'],
-            'round': ['ball', 'circle', 'ring', 'wheel'],
-        }
-        
-        for category, words in associations.items():
-            if category == clue and word in words:
-                score += 50.0
-            if word in words and any(w == clue for w in words):
+        if word in self._ASSOCIATIONS.get(clue, ()):
+            score += 50.0
+        for category in self._WORD_CATS.get(word, ()):
+            if clue in self._ASSOCIATIONS[category]:
                 score += 30.0
         
         return score
@@ -400,7 +649,7 @@ def player_input_clue(game: CodenamesGame, team: str) -> Tuple[str, int]:
                 return ("PASS", 0)
             
             # Check if clue is on the board (not allowed)
-            if clue_input in game.words:
+            if clue_input in game.word_set:
                 print(f"Error: '{clue_input}' is on the board! You cannot use board words as clues.")
                 continue
             
@@ -429,8 +678,7 @@ def player_input_guess(game: CodenamesGame, clue: str, count: int) -> Optional[s
     print("Enter a word from the board, or 'PASS' to stop guessing.\n")
     
     # Show available words
-    available = [w for w in game.words if w not in game.revealed]
-    print("Available words:", ", ".join(available))
+    print("Available words:", ", ".join(game.unrevealed))
     
     while True:
         try:
@@ -439,7 +687,7 @@ def player_input_guess(game: CodenamesGame, clue: str, count: int) -> Optional[s
             if guess == "PASS" or not guess:
                 return None
             
-            if guess not in game.words:
+            if guess not in game.word_set:
                 print(f"'{guess}' is not on the board. Please enter a valid word.")
                 continue
             
@@ -453,24 +701,47 @@ def player_input_guess(game: CodenamesGame, clue: str, count: int) -> Optional[s
             return None
 
 
-def play_game():
-    """Main game loop."""
+def _quiet(*args, **kwargs):
+    """Stand-in for print when game output is disabled."""
+
+
+def play_game(verbose: bool = True, delay: Optional[float] = 0.5,
+              seed: Optional[int] = None,
+              embeddings: Optional[WordEmbeddings] = None,
+              mode: Optional[int] = None, player_team: Optional[str] = None):
+    """
+    Main game loop. Returns the winning team (None if max turns reached).
+    Pass a seed to replay the same board. mode (1-3) and player_team
+    ('RED'/'BLUE') skip the menu prompts; the player modes still ask for
+    clues or guesses. verbose=False hides the game output and never
+    pauses; otherwise delay is the pause (seconds) between turns when not
+    waiting for Enter, doubled before the first turn. Pass embeddings
+    (see load_embeddings) to use the embedding AIs instead of the simple
+    word associations.
+    """
+    say = print if verbose else _quiet
+    interactive = verbose and sys.stdin.isatty()
+    if not verbose:
+        delay = None
+    
     # Get game mode
-    mode = get_mode_selection()
+    if mode is None:
+        mode = get_mode_selection()
     
-    game = CodenamesGame()
+    game = CodenamesGame(seed)
     game.setup_board()
     
     # Determine player team if in player modes
-    player_team = None
-    if mode in [2, 3]:
+    if mode not in [2, 3]:
+        player_team = None
+    elif player_team is None:
         player_team = get_team_selection()
     
     # Create AI players
-    red_spymaster = AISpymaster('RED')
-    red_guesser = AIGuesser('RED')
-    blue_spymaster = AISpymaster('BLUE')
-    blue_guesser = AIGuesser('BLUE')
+    red_spymaster = AISpymaster('RED', embeddings)
+    red_guesser = AIGuesser('RED', embeddings)
+    blue_spymaster = AISpymaster('BLUE', embeddings)
+    blue_guesser = AIGuesser('BLUE', embeddings)
     
     turn_count = 0
     max_turns = 50  # Prevent infinite loops
@@ -478,31 +749,33 @@ def play_game():
     # Show initial board based on mode
     if mode == 1:
         # AI vs AI - show secret view
-        print("\n[Initial board - Secret view]")
-        game.display_board(show_all=True)
+        say("\n[Initial board - Secret view]")
+        if verbose:
+            game.display_board(show_all=True)
     elif mode == 2:
         # Player as operative - don't show secret (they'll see regular board)
-        print("\n[Game starting! You are a field operative for", player_team, "team.]")
-        print("The AI spymaster will give you clues. Good luck!")
+        say("\n[Game starting! You are a field operative for", player_team, "team.]")
+        say("The AI spymaster will give you clues. Good luck!")
     elif mode == 3:
         # Player as spymaster - show secret view
-        print("\n[Initial board - Your secret view as spymaster]")
-        game.display_board(show_all=True)
+        say("\n[Initial board - Your secret view as spymaster]")
+        if verbose:
+            game.display_board(show_all=True)
     
     # Wait for user input if interactive, otherwise auto-start
-    if sys.stdin.isatty():
+    if interactive:
         try:
             input("\nPress Enter to start the game...")
         except (EOFError, KeyboardInterrupt):
             pass
-    else:
-        time.sleep(1)
+    elif delay:
+        time.sleep(delay * 2)
     
     while not game.game_over and turn_count < max_turns:
         turn_count += 1
-        print(f"\n{'=' * 70}")
-        print(f"TURN {turn_count} - {game.turn} TEAM")
-        print('=' * 70)
+        say(f"\n{'=' * 70}")
+        say(f"TURN {turn_count} - {game.turn} TEAM")
+        say('=' * 70)
         
         # Get current team's AI
         if game.turn == 'RED':
@@ -517,11 +790,13 @@ def play_game():
         # Show current board (show secret if player is spymaster, otherwise regular board)
         if mode == 3 and current_team == player_team:
             # Player spymaster sees secret board on their turn
-            print("\n[Secret Board - Your View]")
-            game.display_board(show_all=True)
+            say("\n[Secret Board - Your View]")
+            if verbose:
+                game.display_board(show_all=True)
         else:
             # Regular board view
-            game.display_board()
+            if verbose:
+                game.display_board()
         
         # Spymaster gives clue
         is_player_spymaster = (mode == 3 and current_team == player_team)
@@ -530,11 +805,11 @@ def play_game():
             clue, count = player_input_clue(game, current_team)
         else:
             clue, count = spymaster.generate_clue(game)
-            print(f"[AI SPYMASTER] gives clue: '{clue}' ({count} words)")
+            say(f"[AI SPYMASTER] gives clue: '{clue}' ({count} words)")
         
         if clue == "PASS":
-            print("   Spymaster passes this turn.")
-            game.turn = 'BLUE' if game.turn == 'RED' else 'RED'
+            say("   Spymaster passes this turn.")
+            game.switch_turn()
             continue
         
         # Guesser makes guesses
@@ -550,22 +825,22 @@ def play_game():
             if is_player_operative:
                 guess = player_input_guess(game, clue, count)
                 if guess is None:
-                    print(f"   You pass this turn.")
+                    say(f"   You pass this turn.")
                     turn_ended = True
                     break
-                print(f"   You guess: {guess}")
+                say(f"   You guess: {guess}")
             else:
                 guess = guesser.make_guess(game, clue, count)
                 if guess is None:
-                    print(f"   AI Guesser passes (no confident guess)")
+                    say(f"   AI Guesser passes (no confident guess)")
                     turn_ended = True
                     break
-                print(f"   AI Guesser guesses: {guess}")
+                say(f"   AI Guesser guesses: {guess}")
             
             success, card_type = game.reveal_card(guess)
             
             if not success:
-                print(f"   ❌ Invalid guess!")
+                say(f"   ❌ Invalid guess!")
                 turn_ended = True
                 break
             
@@ -574,64 +849,125 @@ def play_game():
             # Show result
             symbols = {'RED': '[RED]', 'BLUE': '[BLUE]', 'NEUTRAL': '[NEUTRAL]', 'ASSASSIN': '[ASSASSIN]'}
             symbol = symbols.get(card_type, '[?]')
-            print(f"   {symbol} Revealed: {guess} ({card_type})")
+            say(f"   {symbol} Revealed: {guess} ({card_type})")
             
             # Check win condition
             winner = game.check_win_condition()
             if winner:
                 game.game_over = True
                 game.winner = winner
-                print(f"\n{'=' * 70}")
-                print(f"*** {winner} TEAM WINS! ***")
-                print('=' * 70)
+                say(f"\n{'=' * 70}")
+                say(f"*** {winner} TEAM WINS! ***")
+                say('=' * 70)
                 break
             
             # If wrong team or neutral/assassin, turn ends
             if card_type != game.turn:
                 if card_type == 'ASSASSIN':
                     # Assassin revealed - other team wins
-                    other_team = 'BLUE' if game.turn == 'RED' else 'RED'
+                    other_team = _OTHER_TEAM[game.turn]
                     game.game_over = True
                     game.winner = other_team
-                    print(f"\n[X] ASSASSIN REVEALED! {other_team} TEAM WINS!")
+                    say(f"\n[X] ASSASSIN REVEALED! {other_team} TEAM WINS!")
                     break
                 else:
-                    print(f"   Wrong card! Turn ends.")
+                    say(f"   Wrong card! Turn ends.")
                     # Switch turn
-                    game.turn = 'BLUE' if game.turn == 'RED' else 'RED'
+                    game.switch_turn()
                     turn_ended = True
                     turn_already_switched = True
                     break
             
             # If correct card and we've reached max guesses, turn ends
             if guesses_made >= max_guesses:
-                print(f"   Reached maximum guesses ({max_guesses}). Turn ends.")
+                say(f"   Reached maximum guesses ({max_guesses}). Turn ends.")
                 turn_ended = True
         
         # Switch turn if turn ended naturally (passed or reached max guesses with correct cards)
         # Don't switch if wrong card was revealed (already switched above) or game is over
         if not game.game_over and turn_ended and not turn_already_switched:
-            game.turn = 'BLUE' if game.turn == 'RED' else 'RED'
+            game.switch_turn()
         
         # Wait for user input if interactive, otherwise auto-continue
-        if sys.stdin.isatty():
+        if interactive:
             try:
                 input("\nPress Enter to continue...")
             except (EOFError, KeyboardInterrupt):
                 pass
-        else:
-            time.sleep(0.5)
+        elif delay:
+            time.sleep(delay)
     
     # Show final board
-    print("\n[Final Board]")
-    game.display_board(show_all=True)
+    say("\n[Final Board]")
+    if verbose:
+        game.display_board(show_all=True)
     
     if game.game_over:
-        print(f"\n*** Game Over! Winner: {game.winner} TEAM ***")
+        say(f"\n*** Game Over! Winner: {game.winner} TEAM ***")
     else:
-        print("\n*** Game ended (max turns reached) ***")
+        say("\n*** Game ended (max turns reached) ***")
+    
+    return game.winner
+
+
+def simulate_game(seed: Optional[int] = None, max_turns: int = 50,
+                  embeddings: Optional[WordEmbeddings] = None) -> Optional[str]:
+    """
+    Play one AI vs AI game with no printing, prompts or sleeps.
+    Follows the same turn rules as play_game. Returns the winning team,
+    or None if max_turns is reached.
+    """
+    game = CodenamesGame(seed)
+    game.setup_board()
+    
+    spymasters = {t: AISpymaster(t, embeddings) for t in ('RED', 'BLUE')}
+    guessers = {t: AIGuesser(t, embeddings) for t in ('RED', 'BLUE')}
+    
+    for _ in range(max_turns):
+        team = game.turn
+        clue, count = spymasters[team].generate_clue(game)
+        
+        if clue != "PASS":
+            guesser = guessers[team]
+            for _ in range(count + 1):  # Can guess one more than the number
+                guess = guesser.make_guess(game, clue, count)
+                if guess is None:
+                    break
+                
+                success, card_type = game.reveal_card(guess)
+                if not success:
+                    break
+                
+                winner = game.check_win_condition()
+                if winner is None and card_type == 'ASSASSIN':
+                    winner = _OTHER_TEAM[team]
+                if winner:
+                    game.game_over = True
+                    game.winner = winner
+                    return winner
+                
+                # Wrong team or neutral card ends the turn
+                if card_type != team:
+                    break
+        
+        game.switch_turn()
+    
+    return None
+
+
+def simulate_batch(n_games: int, seed: Optional[int] = None, max_turns: int = 50,
+                   embeddings: Optional[WordEmbeddings] = None) -> Dict[Optional[str], int]:
+    """
+    Play n_games silent AI vs AI games and count the winners.
+    Keys are 'RED', 'BLUE' and None (max turns reached).
+    Each game gets its own seed drawn from one seeded stream.
+    """
+    seeds = random.Random(seed)
+    return Counter(simulate_game(seeds.getrandbits(64), max_turns, embeddings)
+                   for _ in range(n_games))
 
 
 if __name__ == "__main__":
-    play_game()
+    # --embeddings switches the AIs to sentence-transformers similarity
+    play_game(embeddings=load_embeddings() if '--embeddings' in sys.argv[1:] else None)
 
@@ -3,6 +3,16 @@ Codenames AI Game - Modern GUI
 A beautiful graphical interface for the Codenames game
 """
 
+import importlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import traceback
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from typing import Optional, Tuple, Dict, List
@@ -10,39 +20,29 @@ import random
 from codenames import (
     CodenamesGame, AISpymaster, AIGuesser, WORD_POOL
 )
+from translation import (
+    COMMON_LANGUAGES, STATIC_TRANSLATIONS_FILE, TRANSLATION_AVAILABLE, create_translator
+)
+
+# Menu entries as (name, description, mode id); player modes first and
+# AI vs AI at the bottom (user preference)
+_MODES = (
+    ("Player as Field Operative", "You guess, AI gives clues", 2),
+    ("Player as Spymaster", "You give clues, AI guesses", 3),
+    ("AI vs AI", "Watch the AI play", 1),
+)
 
-# Translation support
-try:
-    from googletrans import Translator, LANGUAGES
-    TRANSLATION_AVAILABLE = True
-except ImportError:
-    TRANSLATION_AVAILABLE = False
-    print("Note: Translation feature requires 'googletrans' library.")
-    print("Install it with: pip install googletrans==4.0.0rc1")
+if not TRANSLATION_AVAILABLE:
+    print("Note: Translation feature requires the 'requests' or 'googletrans' library.")
+    print("Install it with: pip install requests")
 
-# Common languages for translation
-COMMON_LANGUAGES = {
-    'Chinese (Simplified)': 'zh-cn',
-    'Chinese (Traditional)': 'zh-tw',
-    'Spanish': 'es',
-    'French': 'fr',
-    'German': 'de',
-    'Japanese': 'ja',
-    'Korean': 'ko',
-    'Italian': 'it',
-    'Portuguese': 'pt',
-    'Russian': 'ru',
-    'Arabic': 'ar',
-    'Hindi': 'hi',
-    'Thai': 'th',
-    'Vietnamese': 'vi',
-    'Indonesian': 'id',
-    'Turkish': 'tr',
-    'Dutch': 'nl',
-    'Polish': 'pl',
-    'Greek': 'el',
-    'Czech': 'cs'
-}
+# Translations persist across sessions as {lang: {word: translated}}, keeping
+# only the most recently used entries per language
+TRANSLATION_CACHE_MAX = 4096
+TRANSLATION_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.codenames_translations.json')
+
+# Oldest history lines are dropped past this many
+HISTORY_MAX_LINES = 500
 
 # Official Codenames colors
 COLORS = {
@@ -59,6 +59,28 @@ COLORS = {
     'ERROR': '#DC3545'
 }
 
+# Fonts reused on every board/clue refresh
+_FONT_CARD_9 = ('Arial', 9, 'bold')
+_FONT_CARD_10 = ('Arial', 10, 'bold')
+_FONT_CARD_11 = ('Arial', 11, 'bold')
+_FONT_CLUE = ('Arial', 16, 'bold')
+_FONT_CLUE_WAITING = ('Arial', 18, 'bold')
+
+# Card (bg, fg, font) keyed by (card_type, translated, spymaster_view).
+# Unrevealed cards outside the spymaster view use the 'HIDDEN' type.
+_CARD_STYLE = {}
+for _card_type in ('RED', 'BLUE', 'NEUTRAL', 'ASSASSIN', 'HIDDEN'):
+    _fg = 'white' if _card_type in ('RED', 'BLUE', 'ASSASSIN') else COLORS['TEXT']
+    for _translated in (False, True):
+        # Use larger font for translations - make it more readable
+        _CARD_STYLE[(_card_type, _translated, False)] = (
+            COLORS[_card_type], _fg, _FONT_CARD_11 if _translated else _FONT_CARD_10)
+        # Spymaster cards carry an extra type line, so they run one size smaller
+        _CARD_STYLE[(_card_type, _translated, True)] = (
+            COLORS[_card_type], _fg, _FONT_CARD_10 if _translated else _FONT_CARD_9)
+del _card_type, _fg, _translated
+
+
 class CodenamesGUI:
     """Modern GUI for Codenames game."""
     
@@ -83,25 +105,48 @@ class CodenamesGUI:
         self.turn_in_progress = False
         
         # Game history for display
-        self.game_history = []  # List of history entries
         self.current_turn_entry = None  # Current turn's history entry
+        self._history_buffer: List[str] = []  # lines waiting for _flush_history
         
         # Translation state
         self.translation_enabled = False
         self.translation_language = 'zh-cn'  # Default to Chinese Simplified
         self.translator = None
-        self.translation_cache: Dict[str, str] = {}  # Cache translations
-        self.translation_available = TRANSLATION_AVAILABLE  # Store as instance variable
-        
-        if self.translation_available:
-            try:
-                self.translator = Translator()
-            except Exception as e:
-                print(f"Translation initialization error: {e}")
-                self.translation_available = False
+        self.translation_cache: Dict[str, OrderedDict] = {}  # LRU cache of translations per language
+        self._static_translations = self._load_static_translations()
+        # Pre-built translations work even without a translator library
+        self.translation_available = TRANSLATION_AVAILABLE or bool(self._static_translations)
+        self._cache_save_pending = None  # after() id of the debounced cache save
+        self._load_translation_cache()
+        
+        # Board translations run off the Tk thread; finished requests are
+        # picked up by _poll_translations
+        self._tx_pool = ThreadPoolExecutor(max_workers=2)
+        self._tx_futures = []  # (lang, words, future) for in-flight requests
+        self._tx_pending = set()  # (lang, word) pairs already requested
+        self._tx_failed: Dict[str, set] = {}  # per language: words that failed or came back empty
+        
+        # AI clues and guesses are computed by _ai_worker; _drain_ai applies
+        # the results on the Tk thread
+        self._ai_queue = queue.Queue()  # (kind, token, game snapshot, agent, args) requests
+        self._ai_results = queue.Queue()  # (kind, token, result) replies
+        self._ai_outstanding = 0
+        self._ai_poll_pending = False
+        self._ai_thread = threading.Thread(target=self._ai_worker, daemon=True)
+        self._ai_thread.start()
+        
+        # googletrans install started from the translation toggle
+        self._install_dialog = None
+        self._install_queue = None
         
         # UI Components
         self.card_buttons = []
+        self._card_state = {}
+        self._btn_to_pos: Dict[tk.Button, Tuple[int, int]] = {}
+        self._word_pos: Dict[str, Tuple[int, int]] = {}  # board word -> (row, col)
+        self._card_type_map: Dict[str, str] = {}  # board word -> card type
+        self._update_pending = False  # an update_display is queued via after_idle
+        self.menu_frame = None
         self.game_frame = None
         self.control_frame = None
         self.translate_toggle = None
@@ -109,19 +154,32 @@ class CodenamesGUI:
         self.pass_button = None  # Pass button for player operative
         self.history_text = None  # History text widget
         
+        # Flush the translation cache before the window goes away
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+        
         self.show_menu()
     
     def show_menu(self):
         """Show main menu with mode selection."""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Hide the board; its widgets are reused by the next game
+        if self.game_frame is not None:
+            self.game_frame.pack_forget()
         
-        # Reset game history
-        self.game_history = []
+        # Abandon the running game so pending turns and AI results are dropped
+        if self.game is not None:
+            self.game.game_over = True
+        self._word_pos = {}
+        
+        if self.menu_frame is None:
+            self._build_menu_frame()
+        self.menu_frame.pack(fill=tk.BOTH, expand=True)
+    
+    def _build_menu_frame(self):
+        """Create the main menu widgets."""
+        self.menu_frame = tk.Frame(self.root, bg=COLORS['BACKGROUND'])
         
         # Title
-        title_frame = tk.Frame(self.root, bg=COLORS['BACKGROUND'])
+        title_frame = tk.Frame(self.menu_frame, bg=COLORS['BACKGROUND'])
         title_frame.pack(pady=50)
         
         title_label = tk.Label(
@@ -143,7 +201,7 @@ class CodenamesGUI:
         subtitle_label.pack(pady=(10, 0))
         
         # Mode selection
-        mode_frame = tk.Frame(self.root, bg=COLORS['BACKGROUND'])
+        mode_frame = tk.Frame(self.menu_frame, bg=COLORS['BACKGROUND'])
         mode_frame.pack(pady=50)
         
         tk.Label(
@@ -154,15 +212,7 @@ class CodenamesGUI:
             fg=COLORS['TEXT']
         ).pack(pady=20)
         
-        # Place player modes first and AI vs AI at the bottom (user preference)
-        modes = [
-            ("AI vs AI", "Watch the AI play"),
-            ("Player as Field Operative", "You guess, AI gives clues"),
-            ("Player as Spymaster", "You give clues, AI guesses"),
-            ("AI vs AI", "Watch the AI play")
-        ]
-        
-        for i, (mode_name, description) in enumerate(modes, 1):
+        for mode_name, description, mode_id in _MODES:
             btn = tk.Button(
                 mode_frame,
                 text=f"{mode_name}\n{description}",
@@ -175,7 +225,7 @@ class CodenamesGUI:
                 bd=3,
                 width=30,
                 height=3,
-                command=lambda m=i: self.start_game(m)
+                command=lambda m=mode_id: self.start_game(m)
             )
             btn.pack(pady=10)
             self.hover_effect(btn)
@@ -194,6 +244,10 @@ class CodenamesGUI:
         # Initialize game
         self.game = CodenamesGame()
         self.game.setup_board()
+        # Card types are fixed for the whole game
+        self._card_type_map = {
+            word: self.game.get_card_type(word) for row in self.game.board for word in row
+        }
         
         # Create AI players
         self.red_spymaster = AISpymaster('RED')
@@ -201,9 +255,6 @@ class CodenamesGUI:
         self.blue_spymaster = AISpymaster('BLUE')
         self.blue_guesser = AIGuesser('BLUE')
         
-        # Reset history
-        self.game_history = []
-        
         # Show game board
         self.show_game_board()
         
@@ -291,13 +342,38 @@ class CodenamesGUI:
     
     def show_game_board(self):
         """Display the game board."""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        if self.menu_frame is not None:
+            self.menu_frame.pack_forget()
+        if self.game_frame is None:
+            self._build_game_frame()
+        
+        # Reset the persistent widgets for the new game
+        self._card_state = {}
+        self._word_pos = {
+            self.game.board[i][j]: (i, j) for i in range(5) for j in range(5)
+        }
+        self._hide_spymaster_input()
+        self.clue_label.config(text="Waiting for clue...", font=_FONT_CLUE_WAITING)
+        self.pass_button.config(state=tk.DISABLED)
+        self._history_buffer = []
+        self.history_text.delete(0, tk.END)
+        self.add_history_entry("=== Game Started ===")
         
+        self.game_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self._schedule_update()
+        
+        # Setup player input if needed
+        if self.mode == 3 and self.game.turn == self.player_team:
+            self.setup_spymaster_input()
+        elif self.mode == 2 and self.game.turn == self.player_team:
+            # Will be set up when clue is given
+            pass
+    
+    def _build_game_frame(self):
+        """Create the board, controls and history panel once."""
         # Main container with history panel
         container_frame = tk.Frame(self.root, bg=COLORS['BACKGROUND'])
-        container_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self.game_frame = container_frame
         
         # Left side: Game board
         main_frame = tk.Frame(container_frame, bg=COLORS['BACKGROUND'])
@@ -394,23 +470,23 @@ class CodenamesGUI:
         board_frame = tk.Frame(main_frame, bg=COLORS['BACKGROUND'])
         board_frame.pack(expand=True)
         
-        # Create card buttons
+        # Create card buttons; clicks go through one shared handler.
+        # Words and colours are filled in by update_display
         self.card_buttons = []
         for i in range(5):
             row = []
             for j in range(5):
-                word = self.game.board[i][j]
                 btn = tk.Button(
                     board_frame,
-                    text=word,
-                    font=('Arial', 10, 'bold'),
+                    font=_FONT_CARD_10,
                     width=15,
                     height=4,
                     relief=tk.RAISED,
                     bd=3,
-                    command=lambda w=word: self.on_card_click(w),
                     wraplength=120  # Allow text wrapping for longer words
                 )
+                btn.bind('<ButtonRelease-1>', self._on_card_event)
+                self._btn_to_pos[btn] = (i, j)
                 btn.grid(row=i, column=j, padx=3, pady=3)
                 row.append(btn)
             self.card_buttons.append(row)
@@ -422,7 +498,7 @@ class CodenamesGUI:
         self.clue_label = tk.Label(
             self.control_frame,
             text="Waiting for clue...",
-            font=('Arial', 18, 'bold'),
+            font=_FONT_CLUE_WAITING,
             bg=COLORS['BACKGROUND'],
             fg=COLORS['TEXT'],
             wraplength=600  # Allow text wrapping
@@ -445,21 +521,15 @@ class CodenamesGUI:
         self.hover_effect(self.pass_button)
         
         # Button frame for menu and pass
-        button_frame = tk.Frame(self.control_frame, bg=COLORS['BACKGROUND'])
-        button_frame.pack(pady=10)
+        self._control_buttons_frame = tk.Frame(self.control_frame, bg=COLORS['BACKGROUND'])
+        self._control_buttons_frame.pack(pady=10)
         # Intentionally leave this area for control buttons (menu moved to history panel)
         
+        # Spymaster clue input, packed in place of the clue label when needed
+        self._build_spymaster_input()
+        
         # History panel on the right
         self.setup_history_panel(container_frame)
-        
-        self.update_display()
-        
-        # Setup player input if needed
-        if self.mode == 3 and self.game.turn == self.player_team:
-            self.setup_spymaster_input()
-        elif self.mode == 2 and self.game.turn == self.player_team:
-            # Will be set up when clue is given
-            pass
     
     def setup_history_panel(self, container_frame):
         """Setup history panel on the right side."""
@@ -478,29 +548,26 @@ class CodenamesGUI:
         )
         history_title.pack(pady=(0, 10))
         
-        # Scrollable text widget for history
+        # Scrollable list of history lines
         text_frame = tk.Frame(history_frame, bg=COLORS['BACKGROUND'])
         text_frame.pack(fill=tk.BOTH, expand=True)
         
         scrollbar = tk.Scrollbar(text_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.history_text = tk.Text(
+        self.history_text = tk.Listbox(
             text_frame,
             font=('Courier', 10),
             bg='white',
             fg=COLORS['TEXT'],
-            wrap=tk.WORD,
             yscrollcommand=scrollbar.set,
-            state=tk.DISABLED,
+            activestyle='none',
+            highlightthickness=0,
             width=40,
             height=35
         )
         self.history_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.history_text.yview)
-        
-        # Add welcome message
-        self.add_history_entry("=== Game Started ===")
 
         # Main Menu button placed below the history panel for easier access
         menu_bottom_frame = tk.Frame(history_frame, bg=COLORS['BACKGROUND'])
@@ -520,19 +587,60 @@ class CodenamesGUI:
         self.hover_effect(menu_btn)
     
     def add_history_entry(self, entry: str):
-        """Add an entry to the history panel."""
+        """Add an entry to the history panel.
+        
+        Lines are buffered and written to the Listbox once per idle pass, so
+        the several entries a turn produces cost a single insert and scroll.
+        """
+        lines = entry.split("\n")
         if self.history_text:
-            self.history_text.config(state=tk.NORMAL)
-            self.history_text.insert(tk.END, entry + "\n")
-            self.history_text.see(tk.END)
-            self.history_text.config(state=tk.DISABLED)
+            if not self._history_buffer:
+                self.root.after_idle(self._flush_history)
+            self._history_buffer.extend(lines)
+    
+    def _flush_history(self):
+        """Write buffered history lines to the Listbox."""
+        lines, self._history_buffer = self._history_buffer, []
+        if not lines:
+            return
+        self.history_text.insert(tk.END, *lines)
+        excess = self.history_text.size() - HISTORY_MAX_LINES
+        if excess > 0:
+            self.history_text.delete(0, excess - 1)
+        self.history_text.see(tk.END)
+    
+    def _schedule_update(self):
+        """Refresh the board once the event loop is idle.
+        
+        Several updates requested within one event-loop pass collapse into a
+        single update_display call.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self.root.after_idle(self._do_update)
     
-    def update_display(self):
-        """Update the board display."""
+    def _do_update(self):
+        """Run a refresh requested by _schedule_update."""
+        self._update_pending = False
+        self.update_display()
+    
+    def update_display(self, changed_word: Optional[str] = None):
+        """Update the board display.
+        
+        When changed_word is given (a single reveal) only that card is
+        refreshed; otherwise every card is checked.
+        """
         if self.game is None:
             return
         
-        # Update status
+        self._update_status()
+        if changed_word is None:
+            self._update_cards()
+        else:
+            self._update_cards([self._word_pos[changed_word]])
+    
+    def _update_status(self):
+        """Update the score and turn labels."""
         self.red_label.config(text=f"RED: {self.game.red_remaining}")
         self.blue_label.config(text=f"BLUE: {self.game.blue_remaining}")
         
@@ -541,73 +649,102 @@ class CodenamesGUI:
             text=f"TURN: {self.game.turn}",
             bg=turn_color
         )
+    
+    def _update_cards(self, cells=None):
+        """Reconfigure card buttons whose state changed since the last update.
+        
+        cells limits the check to the given (i, j) positions; by default every
+        card is checked.
+        """
+        if cells is None:
+            cells = [(i, j) for i in range(5) for j in range(5)]
+        
+        # Request any missing translations for these cards in a single
+        # background call; cards show English only until the results come in
+        translations = {}
+        if self.translation_enabled:
+            translations = self.translate_batch([self.game.board[i][j] for i, j in cells])
         
-        # Update cards
-        for i in range(5):
-            for j in range(5):
-                word = self.game.board[i][j]
-                card_type = self.game.get_card_type(word)
-                btn = self.card_buttons[i][j]
-                
-                # Get translation if enabled
-                translation = ""
-                if self.translation_enabled:
-                    translation = self.translate_text(word)
-                
-                # Format text with translation
+        spymaster_view = self.mode == 3 and self.game.turn == self.player_team
+        # Enable hidden cards if player operative turn and it's their turn
+        is_player_turn = (self.mode == 2 and 
+                          self.game.turn == self.player_team and 
+                          self.turn_in_progress)
+        
+        for i, j in cells:
+            word = self.game.board[i][j]
+            
+            # Get translation if enabled
+            translation = translations.get(word, "")
+            
+            revealed = word in self.game.revealed
+            if revealed:
+                # Turn changes don't affect revealed cards
+                state = (True, translation, False, False)
+            else:
+                state = (False, translation, spymaster_view, is_player_turn)
+            if self._card_state.get((i, j)) == state:
+                continue
+            self._card_state[(i, j)] = state
+            
+            card_type = self._card_type_map[word]
+            btn = self.card_buttons[i][j]
+            
+            # Format text with translation
+            if translation:
+                display_text = f"{word}\n{translation}"
+            else:
+                display_text = word
+            
+            if revealed:
+                # Revealed card
+                bg_color, fg_color, font = _CARD_STYLE[(card_type, bool(translation), False)]
+                # Keep original card size
+                btn.config(
+                    text=display_text,
+                    bg=bg_color,
+                    fg=fg_color,
+                    state=tk.DISABLED,
+                    relief=tk.SUNKEN,
+                    font=font
+                )
+            elif spymaster_view:
+                # Spymaster sees secret
+                bg_color, fg_color, font = _CARD_STYLE[(card_type, bool(translation), True)]
                 if translation:
-                    display_text = f"{word}\n{translation}"
-                else:
-                    display_text = word
-                
-                if word in self.game.revealed:
-                    # Revealed card
-                    bg_color = COLORS.get(card_type, COLORS['NEUTRAL'])
-                    fg_color = 'white' if card_type in ['RED', 'BLUE', 'ASSASSIN'] else COLORS['TEXT']
-                    # Use larger font for translations - make it more readable
-                    font_size = 11 if translation else 10
-                    # Keep original card size
-                    btn.config(
-                        text=display_text,
-                        bg=bg_color,
-                        fg=fg_color,
-                        state=tk.DISABLED,
-                        relief=tk.SUNKEN,
-                        font=('Arial', font_size, 'bold')
-                    )
+                    spymaster_text = f"{word}\n({card_type[0]})\n{translation}"
                 else:
-                    # Hidden card
-                    if self.mode == 3 and self.game.turn == self.player_team:
-                        # Spymaster sees secret
-                        bg_color = COLORS.get(card_type, COLORS['NEUTRAL'])
-                        fg_color = 'white' if card_type in ['RED', 'BLUE', 'ASSASSIN'] else COLORS['TEXT']
-                        if translation:
-                            spymaster_text = f"{word}\n({card_type[0]})\n{translation}"
-                        else:
-                            spymaster_text = f"{word}\n({card_type[0]})"
-                        btn.config(
-                            text=spymaster_text,
-                            bg=bg_color,
-                            fg=fg_color,
-                            font=('Arial', 10 if translation else 9, 'bold'),
-                            state=tk.DISABLED
-                        )
-                    else:
-                        # Normal hidden card
-                        # Enable if player operative turn and it's their turn
-                        is_player_turn = (self.mode == 2 and 
-                                         self.game.turn == self.player_team and 
-                                         self.turn_in_progress)
-                        # Use larger font for translations
-                        font_size = 11 if translation else 10
-                        btn.config(
-                            text=display_text,
-                            bg=COLORS['HIDDEN'],
-                            fg=COLORS['TEXT'],
-                            state=tk.NORMAL if is_player_turn else tk.DISABLED,
-                            relief=tk.RAISED,
-                            font=('Arial', font_size, 'bold')
-                        )
+                    spymaster_text = f"{word}\n({card_type[0]})"
+                btn.config(
+                    text=spymaster_text,
+                    bg=bg_color,
+                    fg=fg_color,
+                    font=font,
+                    state=tk.DISABLED
+                )
+            else:
+                # Normal hidden card
+                bg_color, fg_color, font = _CARD_STYLE[('HIDDEN', bool(translation), False)]
+                btn.config(
+                    text=display_text,
+                    bg=bg_color,
+                    fg=fg_color,
+                    state=tk.NORMAL if is_player_turn else tk.DISABLED,
+                    relief=tk.RAISED,
+                    font=font
+                )
+    
+    def _on_card_event(self, event):
+        """Dispatch a click on a card button to on_card_click."""
+        btn = event.widget
+        # Bindings fire for disabled buttons too, and a release outside the
+        # button is not a click
+        if str(btn.cget('state')) == tk.DISABLED:
+            return
+        if not (0 <= event.x < btn.winfo_width() and 0 <= event.y < btn.winfo_height()):
+            return
+        i, j = self._btn_to_pos[btn]
+        self.on_card_click(self.game.board[i][j])
     
     def on_card_click(self, word: str):
         """Handle card click."""
@@ -641,7 +778,7 @@ class CodenamesGUI:
         self.game.turn = 'BLUE' if self.game.turn == 'RED' else 'RED'
         self.pass_button.config(state=tk.DISABLED)
         self.clue_label.config(text="You passed. Waiting for next clue...")
-        self.update_display()
+        self._schedule_update()
         self.root.after(1000, self.process_turn)
     
     def make_guess(self, word: str):
@@ -650,7 +787,7 @@ class CodenamesGUI:
             messagebox.showwarning("Already Revealed", f"'{word}' has already been revealed!")
             return
         
-        if word not in self.game.words:
+        if word not in self._word_pos:
             messagebox.showerror("Invalid", f"'{word}' is not on the board!")
             return
         
@@ -694,7 +831,7 @@ class CodenamesGUI:
             return
         
         # Update display
-        self.update_display()
+        self.update_display(word)
         
         # Check if turn should end
         if card_type != self.game.turn:
@@ -714,25 +851,19 @@ class CodenamesGUI:
             self.clue_label.config(text="Max guesses reached. Waiting for next clue...")
             self.root.after(1000, self.process_turn)
     
-    def setup_spymaster_input(self):
-        """Setup input for player spymaster."""
-        # Clear control frame
-        for widget in self.control_frame.winfo_children():
-            widget.destroy()
-        
-        # Disable pass button during spymaster input (not applicable)
-        if self.pass_button:
-            self.pass_button.config(state=tk.DISABLED)
+    def _build_spymaster_input(self):
+        """Create the (hidden) clue input used by a player spymaster."""
+        self.spymaster_input_frame = tk.Frame(self.control_frame, bg=COLORS['BACKGROUND'])
         
         tk.Label(
-            self.control_frame,
+            self.spymaster_input_frame,
             text="YOUR TURN - SPYMASTER",
             font=('Arial', 18, 'bold'),
             bg=COLORS['BACKGROUND'],
             fg=COLORS['TEXT']
         ).pack(pady=10)
         
-        input_frame = tk.Frame(self.control_frame, bg=COLORS['BACKGROUND'])
+        input_frame = tk.Frame(self.spymaster_input_frame, bg=COLORS['BACKGROUND'])
         input_frame.pack(pady=10)
         
         tk.Label(
@@ -743,9 +874,8 @@ class CodenamesGUI:
             fg=COLORS['TEXT']
         ).pack(side=tk.LEFT, padx=5)
         
-        clue_entry = tk.Entry(input_frame, font=('Arial', 12), width=20)
-        clue_entry.pack(side=tk.LEFT, padx=5)
-        clue_entry.focus()
+        self.clue_entry = tk.Entry(input_frame, font=('Arial', 12), width=20)
+        self.clue_entry.pack(side=tk.LEFT, padx=5)
         
         tk.Label(
             input_frame,
@@ -755,60 +885,8 @@ class CodenamesGUI:
             fg=COLORS['TEXT']
         ).pack(side=tk.LEFT, padx=5)
         
-        count_entry = tk.Entry(input_frame, font=('Arial', 12), width=5)
-        count_entry.pack(side=tk.LEFT, padx=5)
-        
-        def submit_clue():
-            clue = clue_entry.get().strip().upper()
-            try:
-                count = int(count_entry.get())
-            except ValueError:
-                messagebox.showerror("Error", "Please enter a valid number!")
-                return
-            
-            if not clue:
-                messagebox.showerror("Error", "Please enter a clue word!")
-                return
-            
-            if clue in self.game.words:
-                messagebox.showerror("Error", "Clue cannot be a word on the board!")
-                return
-            
-            self.current_clue = clue
-            self.current_count = count
-            self.max_guesses = count + 1
-            self.guesses_made = 0
-            self.turn_in_progress = True
-            
-            # Add to history
-            self.current_turn_entry = f"Turn {self.game.turn}: You gave clue '{clue}' ({count})"
-            self.add_history_entry(f"\n{self.current_turn_entry}")
-            
-            # Clear input
-            for widget in self.control_frame.winfo_children():
-                widget.destroy()
-            
-            clue_text = f"Clue: {clue} ({count} words)\nAI is guessing..."
-            # Put translation inline after the clue instead of below it
-            base_clue = f"Clue: {clue} ({count} words)"
-            if self.translation_enabled:
-                clue_translation = self.translate_text(clue)
-                if clue_translation:
-                    base_clue = f"{base_clue} — {clue_translation}"
-            clue_text = f"{base_clue}\nAI is guessing..."
-            
-            self.clue_label = tk.Label(
-                self.control_frame,
-                text=clue_text,
-                font=('Arial', 16, 'bold'),
-                bg=COLORS['BACKGROUND'],
-                fg=COLORS['TEXT'],
-                wraplength=600
-            )
-            self.clue_label.pack(pady=10)
-            
-            self.update_display()
-            self.root.after(500, self.ai_guesser_turn)
+        self.count_entry = tk.Entry(input_frame, font=('Arial', 12), width=5)
+        self.count_entry.pack(side=tk.LEFT, padx=5)
         
         submit_btn = tk.Button(
             input_frame,
@@ -816,7 +894,7 @@ class CodenamesGUI:
             font=('Arial', 12, 'bold'),
             bg=COLORS['SUCCESS'],
             fg='white',
-            command=submit_clue,
+            command=self.submit_clue,
             padx=20,
             pady=5
         )
@@ -824,8 +902,73 @@ class CodenamesGUI:
         self.hover_effect(submit_btn)
         
         # Bind Enter key
-        clue_entry.bind('<Return>', lambda e: submit_clue())
-        count_entry.bind('<Return>', lambda e: submit_clue())
+        self.clue_entry.bind('<Return>', lambda e: self.submit_clue())
+        self.count_entry.bind('<Return>', lambda e: self.submit_clue())
+    
+    def setup_spymaster_input(self):
+        """Setup input for player spymaster."""
+        # Swap the clue label and pass button for the input
+        self.clue_label.pack_forget()
+        self.pass_button.pack_forget()
+        
+        # Disable pass button during spymaster input (not applicable)
+        self.pass_button.config(state=tk.DISABLED)
+        
+        self.clue_entry.delete(0, tk.END)
+        self.count_entry.delete(0, tk.END)
+        self.spymaster_input_frame.pack(before=self._control_buttons_frame)
+        self.clue_entry.focus()
+    
+    def _hide_spymaster_input(self):
+        """Put the clue label and pass button back in place of the input."""
+        if not self.spymaster_input_frame.winfo_manager():
+            return
+        self.spymaster_input_frame.pack_forget()
+        self.clue_label.pack(pady=10, before=self._control_buttons_frame)
+        self.pass_button.pack(pady=5, before=self._control_buttons_frame)
+    
+    def submit_clue(self):
+        """Submit the player spymaster's clue and let the AI guess."""
+        clue = self.clue_entry.get().strip().upper()
+        try:
+            count = int(self.count_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number!")
+            return
+        
+        if not clue:
+            messagebox.showerror("Error", "Please enter a clue word!")
+            return
+        
+        if clue in self.game.word_set:
+            messagebox.showerror("Error", "Clue cannot be a word on the board!")
+            return
+        
+        self.current_clue = clue
+        self.current_count = count
+        self.max_guesses = count + 1
+        self.guesses_made = 0
+        self.turn_in_progress = True
+        
+        # Add to history
+        self.current_turn_entry = f"Turn {self.game.turn}: You gave clue '{clue}' ({count})"
+        self.add_history_entry(f"\n{self.current_turn_entry}")
+        
+        # Clear input
+        self._hide_spymaster_input()
+        
+        # Put translation inline after the clue instead of below it
+        inline = ""
+        if self.translation_enabled:
+            clue_translation = self.translate_text(clue)
+            if clue_translation:
+                inline = f" — {clue_translation}"
+        clue_text = f"Clue: {clue} ({count} words){inline}\nAI is guessing..."
+        
+        self.clue_label.config(text=clue_text, font=_FONT_CLUE)
+        
+        self._schedule_update()
+        self.root.after(500, self.ai_guesser_turn)
     
     def ai_turn(self):
         """Process AI turn (wrapper for compatibility)."""
@@ -850,7 +993,11 @@ class CodenamesGUI:
         else:
             spymaster = self.blue_spymaster
         
-        clue, count = spymaster.generate_clue(self.game)
+        self._request_ai('clue', spymaster)
+    
+    def _apply_clue(self, clue: str, count: int):
+        """Show an AI spymaster's clue and hand over to the guessers."""
+        current_team = self.game.turn
         
         if clue == "PASS":
             self.clue_label.config(text="AI Spymaster passed. Switching turns...")
@@ -870,33 +1017,29 @@ class CodenamesGUI:
         self.current_turn_entry = f"Turn {current_team}: {spymaster_name} gave clue '{clue}' ({count})"
         self.add_history_entry(f"\n{self.current_turn_entry}")
         
-        self.update_display()
+        # Request the clue together with any untranslated board words; the
+        # translation is shown inline after the clue
+        inline = ""
+        if self.translation_enabled:
+            clue_translation = self.translate_batch([clue, *self.game.words]).get(clue, "")
+            if clue_translation:
+                inline = f" — {clue_translation}"
+        
+        self._schedule_update()
         
         # AI or player guesses
         if self.mode == 2 and current_team == self.player_team:
             # Player operative guesses
-            # Show translation inline after the clue
-            base_clue = f"Clue: {clue} ({count} words)"
-            if self.translation_enabled:
-                clue_translation = self.translate_text(clue)
-                if clue_translation:
-                    base_clue = f"{base_clue} — {clue_translation}"
-            clue_text = f"{base_clue}\nYour turn to guess! Click a card or pass."
-            self.clue_label.config(text=clue_text, font=('Arial', 16, 'bold'))
+            clue_text = f"Clue: {clue} ({count} words){inline}\nYour turn to guess! Click a card or pass."
+            self.clue_label.config(text=clue_text, font=_FONT_CLUE)
             # Show pass button for player operative
             self.pass_button.config(state=tk.NORMAL)
-            self.update_display()
+            self._schedule_update()
         else:
             # AI guesses - hide pass button
             self.pass_button.config(state=tk.DISABLED)
-            # Show translation inline after the AI clue
-            base_clue = f"AI Clue: {clue} ({count} words)"
-            if self.translation_enabled:
-                clue_translation = self.translate_text(clue)
-                if clue_translation:
-                    base_clue = f"{base_clue} — {clue_translation}"
-            clue_text = f"{base_clue}\nAI is guessing..."
-            self.clue_label.config(text=clue_text, font=('Arial', 16, 'bold'))
+            clue_text = f"AI Clue: {clue} ({count} words){inline}\nAI is guessing..."
+            self.clue_label.config(text=clue_text, font=_FONT_CLUE)
             self.root.after(1000, self.ai_guesser_turn)
     
     def ai_guesser_turn(self):
@@ -909,7 +1052,7 @@ class CodenamesGUI:
             self.turn_in_progress = False
             self.game.turn = 'BLUE' if self.game.turn == 'RED' else 'RED'
             self.clue_label.config(text="Max guesses reached. Next turn...")
-            self.update_display()
+            self._schedule_update()
             self.current_turn_entry = None
             self.root.after(2000, self.process_turn)
             return
@@ -920,7 +1063,13 @@ class CodenamesGUI:
         else:
             guesser = self.blue_guesser
         
-        guess = guesser.make_guess(self.game, self.current_clue, self.current_count)
+        self._request_ai('guess', guesser, self.current_clue, self.current_count)
+    
+    def _apply_guess(self, guess: Optional[str]):
+        """Reveal an AI guesser's pick and decide whether the turn continues."""
+        if not self.turn_in_progress:
+            return
+        current_team = self.game.turn
         
         if guess is None:
             # AI passes
@@ -928,7 +1077,7 @@ class CodenamesGUI:
             self.game.turn = 'BLUE' if self.game.turn == 'RED' else 'RED'
             self.clue_label.config(text="AI passed. Next turn...")
             self.add_history_entry(f"  → AI passed")
-            self.update_display()
+            self._schedule_update()
             self.current_turn_entry = None
             self.root.after(2000, self.process_turn)
             return
@@ -943,7 +1092,7 @@ class CodenamesGUI:
         self.guesses_made += 1
         
         # Update display
-        self.update_display()
+        self.update_display(guess)
         
         # Add to history
         result_symbol = "✓" if card_type == current_team else "✗"
@@ -983,105 +1132,355 @@ class CodenamesGUI:
             self.turn_in_progress = False
             self.game.turn = 'BLUE' if self.game.turn == 'RED' else 'RED'
             self.clue_label.config(text=f"Wrong card ({card_type}). Turn ends.")
-            self.update_display()
+            self._schedule_update()
             self.current_turn_entry = None
             self.root.after(2000, self.process_turn)
         else:
             # Correct card - continue guessing
             self.root.after(1500, self.ai_guesser_turn)
     
+    def _request_ai(self, kind: str, agent, *args):
+        """Queue an AI clue ('clue') or guess ('guess') for the worker thread.
+        
+        The worker gets a snapshot of the game, so moves made on the Tk
+        thread meanwhile can't change what it reads.
+        """
+        self._ai_outstanding += 1
+        self._ai_queue.put((kind, self._ai_token(), self.game.snapshot(), agent, args))
+        if not self._ai_poll_pending:
+            self._ai_poll_pending = True
+            self.root.after(50, self._drain_ai)
+    
+    def _ai_worker(self):
+        """Compute queued AI requests off the Tk thread; never touches widgets."""
+        while True:
+            kind, token, game, agent, args = self._ai_queue.get()
+            try:
+                if kind == 'clue':
+                    result = agent.generate_clue(game)
+                else:
+                    result = agent.make_guess(game, *args)
+            except Exception:
+                traceback.print_exc()
+                kind, result = 'error', None
+            self._ai_results.put((kind, token, result))
+    
+    def _ai_token(self):
+        """The position an AI request is for: game, team to play and cards revealed."""
+        return (self.game, self.game.turn, len(self.game.revealed))
+    
+    def _drain_ai(self):
+        """Apply finished AI requests on the Tk thread."""
+        self._ai_poll_pending = False
+        while True:
+            try:
+                kind, token, result = self._ai_results.get_nowait()
+            except queue.Empty:
+                break
+            self._ai_outstanding -= 1
+            # Drop results for a game that has since ended or been replaced,
+            # or for a position that has moved on (turn passed, card revealed)
+            if self.game is None or self.game.game_over or token != self._ai_token():
+                continue
+            if kind == 'clue':
+                self._apply_clue(*result)
+            elif kind == 'guess':
+                self._apply_guess(result)
+        if self._ai_outstanding and not self._ai_poll_pending:
+            self._ai_poll_pending = True
+            self.root.after(50, self._drain_ai)
+    
     def translate_text(self, text: str) -> str:
-        """Translate text to selected language."""
+        """Translate text to selected language.
+        
+        Never blocks: on a cache miss the text is queued for background
+        translation and "" is returned; the clue label and board are
+        refreshed once the result arrives.
+        """
         if not self.translation_available or not self.translation_enabled or not text:
             return ""
         
-        # Check cache
-        cache_key = f"{text}_{self.translation_language}"
-        if cache_key in self.translation_cache:
-            return self.translation_cache[cache_key]
+        return self.translate_batch([text]).get(text, "")
+    
+    def translate_batch(self, texts: List[str]) -> Dict[str, str]:
+        """Translate several texts with at most one request.
+        
+        Returns the translations available right now (pre-built or cached);
+        anything missing is requested in one background call, like
+        translate_text.
+        """
+        if not self.translation_available or not self.translation_enabled:
+            return {}
+        
+        self._fetch_translations(texts)
+        lang_cache = self._translations_for(self.translation_language)
+        found = {t: lang_cache[t] for t in texts if t in lang_cache}
+        
+        # Mark cache hits as recently used
+        cache = lang_cache.maps[0]
+        for text in found:
+            if text in cache:
+                cache.move_to_end(text)
+        return found
+    
+    def _translations_for(self, lang: str) -> ChainMap:
+        """Known translations for lang: cached results first, then the pre-built table."""
+        return ChainMap(self.translation_cache.setdefault(lang, OrderedDict()),
+                        self._static_translations.get(lang, {}))
+    
+    def _ensure_translator(self) -> bool:
+        """Create the translator on first use; return whether one exists."""
+        if self.translator is None and TRANSLATION_AVAILABLE:
+            try:
+                self.translator = create_translator()
+            except Exception as e:
+                print(f"Failed to initialize translator: {e}")
+        return self.translator is not None
+    
+    def _fetch_translations(self, texts: List[str]):
+        """Translate all uncached texts with a single background translator request.
         
-        try:
-            if self.translator is None:
-                # Try to reinitialize translator
-                try:
-                    from googletrans import Translator
-                    self.translator = Translator()
-                except Exception as e:
-                    print(f"Failed to initialize translator: {e}")
-                    return ""
-            
-            if self.translator:
-                # Use a smaller batch or single translation
-                translation = self.translator.translate(text, dest=self.translation_language)
-                if translation and translation.text:
-                    translated = translation.text
-                    self.translation_cache[cache_key] = translated
-                    return translated
-        except Exception as e:
-            print(f"Translation error for '{text}': {e}")
-            # Don't cache failed translations
-            return ""
+        The request runs on the translation pool; _poll_translations stores
+        the results and refreshes the display once it completes.
+        """
+        if not self.translation_available or not self.translation_enabled:
+            return
         
-        return ""
+        lang = self.translation_language
+        lang_cache = self._translations_for(lang)
+        failed = self._tx_failed.get(lang, ())
+        needed = [t for t in dict.fromkeys(texts)
+                  if t and t not in lang_cache and t not in failed
+                  and (lang, t) not in self._tx_pending]
+        if not needed:
+            return
+        
+        if not self._ensure_translator():
+            # Only the pre-built translations are available
+            return
+        
+        future = self._tx_pool.submit(self.translator.translate, needed, dest=lang)
+        if not self._tx_futures:
+            self.root.after(50, self._poll_translations)
+        self._tx_futures.append((lang, needed, future))
+        self._tx_pending.update((lang, t) for t in needed)
+    
+    def _store_translations(self, lang: str, texts: List[str], results) -> set:
+        """Add translator results for texts to the cache; return the texts stored.
+        
+        Texts that came back empty are remembered in _tx_failed so they are
+        not requested again.
+        """
+        lang_cache = self.translation_cache.setdefault(lang, OrderedDict())
+        stored = set()
+        for text, translation in zip(texts, results):
+            if translation and translation.text:
+                lang_cache[text] = translation.text
+                lang_cache.move_to_end(text)
+                stored.add(text)
+        self._tx_failed.setdefault(lang, set()).update(t for t in texts if t not in stored)
+        if not stored:
+            return stored
+        # Drop the least recently used entries
+        while len(lang_cache) > TRANSLATION_CACHE_MAX:
+            lang_cache.popitem(last=False)
+        self._schedule_cache_save()
+        return stored
+    
+    def _poll_translations(self):
+        """Apply finished background translations and refresh the display."""
+        still_running = []
+        applied = False
+        clue_translated = False
+        for lang, texts, future in self._tx_futures:
+            if not future.done():
+                still_running.append((lang, texts, future))
+                continue
+            self._tx_pending.difference_update((lang, t) for t in texts)
+            try:
+                stored = self._store_translations(lang, texts, future.result())
+            except Exception as e:
+                # Don't cache failed translations, and don't retry them either
+                print(f"Translation error for {len(texts)} word(s): {e}")
+                self._tx_failed.setdefault(lang, set()).update(texts)
+                continue
+            # Only redraw when something new can be shown
+            applied = applied or bool(stored)
+            clue_translated = clue_translated or (
+                lang == self.translation_language and self.current_clue in stored)
+        
+        self._tx_futures = still_running
+        if still_running:
+            self.root.after(50, self._poll_translations)
+        if applied and self.card_buttons:
+            self._schedule_update()
+        # Patch the translation into the clue label if it still shows the clue
+        if (clue_translated and self.translation_enabled
+                and self.current_clue in self.clue_label.cget('text')):
+            self.update_clue_display()
+    
+    def _load_static_translations(self) -> Dict[str, Dict[str, str]]:
+        """Load the pre-built WORD_POOL translations (translations.json), if present."""
+        try:
+            with open(STATIC_TRANSLATIONS_FILE, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {lang: words for lang, words in data.items() if isinstance(words, dict)}
+    
+    def _load_translation_cache(self):
+        """Load previously saved translations from disk."""
+        try:
+            with open(TRANSLATION_CACHE_FILE, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            for lang, words in data.items():
+                if isinstance(words, dict):
+                    # Saved oldest first, so the tail is the most recently used
+                    self.translation_cache[lang] = OrderedDict(
+                        list(words.items())[-TRANSLATION_CACHE_MAX:])
+    
+    def _schedule_cache_save(self):
+        """Save the translation cache once things have been quiet for 2s."""
+        if self._cache_save_pending is not None:
+            self.root.after_cancel(self._cache_save_pending)
+        self._cache_save_pending = self.root.after(2000, self._save_translation_cache)
+    
+    def _save_translation_cache(self):
+        """Write the translation cache to disk."""
+        self._cache_save_pending = None
+        try:
+            tmp_path = TRANSLATION_CACHE_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.translation_cache, f, ensure_ascii=False)
+            os.replace(tmp_path, TRANSLATION_CACHE_FILE)
+        except OSError as e:
+            print(f"Failed to save translation cache: {e}")
+    
+    def _flush_translation_cache(self):
+        """Write a pending debounced cache save right away."""
+        if self._cache_save_pending is not None:
+            self.root.after_cancel(self._cache_save_pending)
+            self._save_translation_cache()
+    
+    def _on_close(self):
+        """Flush pending cache writes and close the window."""
+        self._flush_translation_cache()
+        self._tx_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def toggle_translation(self):
         """Toggle translation on/off."""
         if not self.translation_available:
             result = messagebox.askyesno(
                 "Translation Not Available",
-                "Translation feature requires the 'googletrans' library.\n\n"
-                "Would you like to install it now?\n"
-                "(You can also install manually: pip install googletrans==4.0.0rc1)"
+                "Translation needs either the 'requests' or the 'googletrans' library.\n\n"
+                "Would you like to install googletrans now?\n"
+                "(You can also install either manually: pip install requests)"
             )
             if result:
-                import subprocess
-                import sys
-                try:
-                    subprocess.check_call([sys.executable, "-m", "pip", "install", "googletrans==4.0.0rc1"])
-                    messagebox.showinfo("Success", "googletrans installed! Please restart the application.")
-                    # Try to reimport
-                    try:
-                        from googletrans import Translator
-                        self.translation_available = True
-                        self.translator = Translator()
-                        self.translate_toggle.config(
-                            text="🌐 Translation: OFF",
-                            bg=COLORS['BUTTON_BG'],
-                            state=tk.NORMAL
-                        )
-                        self.language_combo.config(state='readonly')
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to initialize translator: {e}")
-                except Exception as e:
-                    messagebox.showerror("Installation Failed", f"Failed to install googletrans: {e}\n\nPlease install manually:\npip install googletrans==4.0.0rc1")
+                self._start_googletrans_install()
             return
         
         self.translation_enabled = not self.translation_enabled
         
         if self.translation_enabled:
+            self._ensure_translator()
+            # Give words that failed earlier another chance
+            self._tx_failed.clear()
             self.translate_toggle.config(text="🌐 Translation: ON", bg=COLORS['SUCCESS'])
             self.language_combo.config(state='readonly')
-            # Clear cache and retranslate everything
-            self.translation_cache.clear()
         else:
             self.translate_toggle.config(text="🌐 Translation: OFF", bg=COLORS['BUTTON_BG'])
             self.language_combo.config(state='disabled')
+            self._flush_translation_cache()
         
         # Update display with new translation state
-        self.update_display()
+        self._schedule_update()
         if self.current_clue:
             self.update_clue_display()
     
+    def _start_googletrans_install(self):
+        """Install googletrans on a worker thread behind a progress dialog."""
+        self.translate_toggle.config(state=tk.DISABLED)
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Installing googletrans")
+        dialog.configure(bg=COLORS['BACKGROUND'])
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        # The dialog closes itself once pip finishes
+        dialog.protocol('WM_DELETE_WINDOW', lambda: None)
+        
+        tk.Label(
+            dialog,
+            text="Installing googletrans, please wait...",
+            font=('Arial', 12),
+            bg=COLORS['BACKGROUND'],
+            fg=COLORS['TEXT']
+        ).pack(padx=20, pady=(20, 10))
+        progress = ttk.Progressbar(dialog, mode='indeterminate', length=280)
+        progress.pack(padx=20, pady=(0, 20))
+        progress.start(15)
+        
+        self._install_dialog = dialog
+        self._install_queue = queue.Queue()
+        threading.Thread(target=self._do_pip_install, daemon=True).start()
+        self.root.after(200, self._poll_install_queue)
+    
+    def _do_pip_install(self):
+        """Run pip off the Tk thread and report (returncode, output) on _install_queue."""
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "pip", "install", "googletrans==4.0.0rc1"],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            )
+            output, _ = proc.communicate()
+            self._install_queue.put((proc.returncode, output))
+        except Exception as e:
+            self._install_queue.put((None, str(e)))
+    
+    def _poll_install_queue(self):
+        """Wait for the pip worker, then close the progress dialog and report."""
+        try:
+            returncode, output = self._install_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(200, self._poll_install_queue)
+            return
+        
+        self._install_dialog.destroy()
+        self._install_dialog = None
+        self.translate_toggle.config(state=tk.NORMAL)
+        
+        if returncode != 0:
+            lines = output.strip().splitlines()
+            reason = lines[-1] if lines else f"pip exited with status {returncode}"
+            messagebox.showerror("Installation Failed", f"Failed to install googletrans: {reason}\n\nPlease install manually:\npip install googletrans==4.0.0rc1")
+            return
+        
+        messagebox.showinfo("Success", "googletrans installed! Please restart the application.")
+        # Try to import the freshly installed package
+        try:
+            importlib.invalidate_caches()
+            self.translator = create_translator()
+            self.translation_available = True
+            self.translate_toggle.config(text="🌐 Translation: OFF", bg=COLORS['BUTTON_BG'])
+            self.language_combo.config(state='readonly')
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to initialize translator: {e}")
+    
     def on_language_change(self, event=None):
         """Handle language selection change."""
         if self.translation_available:
             selected_lang = self.language_combo.get()
             if selected_lang in COMMON_LANGUAGES:
                 self.translation_language = COMMON_LANGUAGES[selected_lang]
-                # Clear cache for new language
-                self.translation_cache.clear()
                 # Update display
-                self.update_display()
+                self._schedule_update()
                 if self.current_clue:
                     self.update_clue_display()
     
@@ -1097,38 +1496,26 @@ class CodenamesGUI:
 
         current_text = self.clue_label.cget('text')
         # Split first line (the clue) from the rest
-        if '\n' in current_text:
-            first_line, rest = current_text.split('\n', 1)
-            rest = '\n' + rest
-        else:
-            first_line = current_text
-            rest = ''
-
-        # Remove any existing inline translation from the first line
-        if ' — ' in first_line:
-            first_line = first_line.split(' — ')[0]
+        first_line, newline, rest = current_text.partition('\n')
+        # Strip any existing inline translation from the first line
+        first_line, had_translation, _ = first_line.partition(' — ')
+        if not clue_translation and not had_translation:
+            # Nothing to add or remove
+            return
 
         if clue_translation:
             first_line = f"{first_line} — {clue_translation}"
 
         self.clue_label.config(
-            text=f"{first_line}{rest}",
-            font=('Arial', 16, 'bold'),
+            text=f"{first_line}{newline}{rest}",
+            font=_FONT_CLUE,
             wraplength=600
         )
     
     def hover_effect(self, button):
         """Add hover effect to button."""
-        original_bg = button.cget('bg')
-
-        def on_enter(e):
-            button.config(cursor="hand2")
-        
-        def on_leave(e):
-            button.config(cursor="")
-        
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
+        # Tk swaps the cursor itself while the pointer is over the widget
+        button.config(cursor="hand2")
     
     def run(self):
         """Start the GUI."""
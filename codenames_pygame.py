@@ -18,11 +18,14 @@ This prototype uses the game logic in `codenames.py` for board setup and card ro
 import sys
 import os
 import time
+import queue
+import threading
 import math
 import random
 
 try:
     import pygame
+    import pygame.freetype
     from pygame import gfxdraw
 except Exception as e:
     print("pygame is required. Install with: pip install pygame")
@@ -42,6 +45,21 @@ COL_BOARD_BG = pygame.Color('#1D3557')  # Board background
 COL_BEIGE = pygame.Color('#F4A261')     # Input areas
 COL_TEXT_DARK = pygame.Color('#1D3557')
 COL_WHITE = pygame.Color('#FFFFFF')
+COL_HIDDEN = pygame.Color('#F8F4EA')    # light card front
+
+# Revealed card (background, text) and spymaster dot colour per role
+ROLE_BG_TEXT = {
+    'RED': (COL_RED, COL_WHITE),
+    'BLUE': (COL_BLUE, COL_WHITE),
+    'ASSASSIN': (COL_ASSASSIN, COL_ASSASSIN_TEXT),
+    'NEUTRAL': (COL_NEUTRAL, COL_NEUTRAL_TEXT),
+}
+ROLE_DOT = {
+    'RED': COL_RED,
+    'BLUE': COL_BLUE,
+    'ASSASSIN': COL_ASSASSIN,
+    'NEUTRAL': COL_NEUTRAL_TEXT,
+}
 
 SHADOW_OFFSET = (4, 4)
 
@@ -53,11 +71,27 @@ BASE_GAP = 15
 CARD_RADIUS = 8
 
 FPS = 60
-
-# Utility lerp
-def lerp(a, b, t):
-    return a + (b - a) * t
-
+IDLE_FPS = 30  # event polling rate while nothing needs redrawing
+
+# Pre-rendered card faces (shadow, background, word, spymaster dot), keyed by
+# everything that affects how they look. Cleared on relayout.
+_CARD_SURF_CACHE = {}
+
+# Alpha of the black dim drawn behind each overlay
+DIM_POPUP = 160
+DIM_CONFIRM = 160
+DIM_ROLE_SELECT = 180
+DIM_HELP = 200
+
+HELP_LINES = (
+    'Help - Controls',
+    'Mouse: Hover to highlight, click to select/deselect (Operative)',
+    'Space: Confirm selected card (Operative)',
+    'Enter: Submit clue (Spymaster)',
+    'Esc: Clear selection / close overlays',
+    'F1: Toggle this help',
+    'Q: Quit',
+)
 
 class CardView:
     def __init__(self, word, rect, role):
@@ -69,69 +103,43 @@ class CardView:
         self.reveal_progress = 0.0  # 0.0 -> 1.0 animation
         self.selected = False
         self.hovered = False
+        # Word surfaces, filled in by prerender_text at layout time
+        self._text_hidden = None
+        self._text_revealed = None
 
     def center(self):
         return self.rect.center
 
-    def draw(self, surf, fonts, mode_spymaster=False):
-        # Draw shadow
-        sx = self.rect.x + SHADOW_OFFSET[0]
-        sy = self.rect.y + SHADOW_OFFSET[1]
-        shadow_r = pygame.Rect(sx, sy, self.rect.w, self.rect.h)
-        shadow_color = (0, 0, 0, 80)
-        shadow_surf = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, shadow_color, shadow_surf.get_rect(), border_radius=CARD_RADIUS)
-        surf.blit(shadow_surf, (sx, sy))
-
+    def colors(self, revealed):
+        """Return (background, text colour) for the hidden or revealed card."""
         # Background: if revealed, color by role
-        if self.revealed:
-            if self.role == 'RED':
-                bg = COL_RED
-                text_col = COL_WHITE
-            elif self.role == 'BLUE':
-                bg = COL_BLUE
-                text_col = COL_WHITE
-            elif self.role == 'ASSASSIN':
-                bg = COL_ASSASSIN
-                text_col = COL_ASSASSIN_TEXT
-            else:
-                bg = COL_NEUTRAL
-                text_col = COL_NEUTRAL_TEXT
-        else:
-            # Hidden state background
-            bg = pygame.Color('#F8F4EA')  # light card front
-            text_col = COL_TEXT_DARK
+        return ROLE_BG_TEXT[self.role] if revealed else (COL_HIDDEN, COL_TEXT_DARK)
+
+    def prerender_text(self, font):
+        """Render the word in its hidden and revealed colours; done at layout time."""
+        self._text_hidden = font.render(self.word, True, self.colors(False)[1])
+        self._text_revealed = font.render(self.word, True, self.colors(True)[1])
+
+    def draw(self, surf, fonts, mode_spymaster=False):
+        bg, text_col = self.colors(self.revealed)
 
         # Apply reveal animation overlay (fade)
         if self.reveal_progress > 0.0 and not self.revealed:
             # during animation, we still show hidden bg but with a subtle effect
             pass
 
-        # Draw rounded rect
-        pygame.draw.rect(surf, bg, self.rect, border_radius=CARD_RADIUS)
-
-        # Draw word
-        font = fonts['card']
-        text_surf = font.render(self.word, True, text_col)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surf.blit(text_surf, text_rect)
-
         # If spymaster mode, draw small role dot
-        if mode_spymaster:
-            dot_r = max(5, int(self.rect.h * 0.06))
-            dot_x = self.rect.right - dot_r - 6
-            dot_y = self.rect.top + 6
-            if self.role == 'RED':
-                dot_col = COL_RED
-            elif self.role == 'BLUE':
-                dot_col = COL_BLUE
-            elif self.role == 'ASSASSIN':
-                dot_col = COL_ASSASSIN
-            else:
-                dot_col = COL_NEUTRAL_TEXT
+        dot_col = ROLE_DOT[self.role] if mode_spymaster else None
 
-            pygame.gfxdraw.filled_circle(surf, dot_x, dot_y, dot_r, dot_col)
-            pygame.gfxdraw.aacircle(surf, dot_x, dot_y, dot_r, (0,0,0))
+        font = fonts['card']
+        key = (self.rect.w, self.rect.h, tuple(bg), tuple(text_col), self.word,
+               dot_col and tuple(dot_col), font)
+        face = _CARD_SURF_CACHE.get(key)
+        if face is None:
+            text_surf = self._text_revealed if self.revealed else self._text_hidden
+            face = self._render_face(text_surf, bg, dot_col)
+            _CARD_SURF_CACHE[key] = face
+        surf.blit(face, self.rect.topleft)
 
         # Hover/selection outline
         if self.hovered and not self.revealed:
@@ -140,13 +148,41 @@ class CardView:
             outline_col = COL_RED if self.role == 'RED' else (COL_BLUE if self.role == 'BLUE' else COL_TEXT_DARK)
             pygame.draw.rect(surf, outline_col, self.rect, width=3, border_radius=CARD_RADIUS)
 
+    def _render_face(self, text_surf, bg, dot_col):
+        """Render shadow, card, word and optional role dot onto one surface."""
+        w, h = self.rect.size
+        face = pygame.Surface((w + SHADOW_OFFSET[0], h + SHADOW_OFFSET[1]), pygame.SRCALPHA)
+        card_r = pygame.Rect(0, 0, w, h)
+
+        # Draw shadow
+        shadow_color = (0, 0, 0, 80)
+        pygame.draw.rect(face, shadow_color, card_r.move(SHADOW_OFFSET), border_radius=CARD_RADIUS)
+
+        # Draw rounded rect
+        pygame.draw.rect(face, bg, card_r, border_radius=CARD_RADIUS)
+
+        # Draw word
+        text_rect = text_surf.get_rect(center=card_r.center)
+        face.blit(text_surf, text_rect)
+
+        if dot_col is not None:
+            dot_r = max(5, int(h * 0.06))
+            dot_x = card_r.right - dot_r - 6
+            dot_y = card_r.top + 6
+            pygame.gfxdraw.filled_circle(face, dot_x, dot_y, dot_r, dot_col)
+            pygame.gfxdraw.aacircle(face, dot_x, dot_y, dot_r, (0,0,0))
+
+        return face.convert_alpha()
+
     def update(self, dt):
-        # animate reveal progress toward revealed state
-        target = 1.0 if self.revealed else 0.0
-        if self.reveal_progress < target:
-            self.reveal_progress = min(target, self.reveal_progress + dt * 3.0)
-        elif self.reveal_progress > target:
-            self.reveal_progress = max(target, self.reveal_progress - dt * 3.0)
+        """Advance the reveal animation; returns True if the card changed."""
+        # animate reveal progress toward revealed state (1.0) or back to 0.0
+        step = dt * 3.0 if self.revealed else -dt * 3.0
+        progress = min(1.0, max(0.0, self.reveal_progress + step))
+        if progress == self.reveal_progress:
+            return False
+        self.reveal_progress = progress
+        return True
 
 
 class PygameUI:
@@ -165,11 +201,36 @@ class PygameUI:
             'sub': pygame.font.SysFont('Arial', 22),
             'card': pygame.font.SysFont('Arial', 18, bold=True),
             'input': pygame.font.SysFont('Arial', 20),
+            # Text that changes every time it is shown is drawn with freetype
+            # straight onto the screen, without a temporary Surface
+            'title_ft': pygame.freetype.SysFont('Arial', 36, bold=True),
         }
 
-        # Game
-        self.game = codenames.CodenamesGame()
-        self.game.setup_board()
+        # Static text is rendered once
+        self._title_surf = self.fonts['title'].render('Codenames', True, COL_WHITE)
+        hint = 'Spymaster: Enter "Clue Number" | Operative: Click a card and press Space to confirm'
+        self._hint_surf = self.fonts['input'].render(hint, True, COL_TEXT_DARK)
+        self._help_surfs = [
+            (self.fonts['title'] if i == 0 else self.fonts['sub']).render(line, True, COL_WHITE)
+            for i, line in enumerate(HELP_LINES)
+        ]
+        self._role_surfs = (
+            self.fonts['title'].render('Choose Role & Team', True, COL_WHITE),
+            self.fonts['sub'].render('Spymaster (Red)', True, COL_WHITE),
+            self.fonts['sub'].render('Operative (Red)', True, COL_TEXT_DARK),
+            self.fonts['sub'].render('Operative (Blue)', True, COL_TEXT_DARK),
+        )
+        self._confirm_hint_surf = self.fonts['sub'].render('Press Space to confirm, Esc to cancel', True, COL_WHITE)
+        self._loading_surf = self.fonts['sub'].render('Loading board...', True, COL_WHITE)
+        self._popup_text = (None, None)  # (text, rendered surface)
+        self._sub_cache = {}  # text -> surface, for the few turn strings
+
+        # Game; the board is set up on a worker thread while the role
+        # select screen is already showing, and picked up in update()
+        self.game = None
+        self._game_queue = queue.Queue()
+        self._pending_role = None  # role chosen before the board was ready
+        threading.Thread(target=self._bg_init_game, daemon=True).start()
 
         # Build CardView objects
         self.cards = []
@@ -185,6 +246,12 @@ class PygameUI:
         # Role selection state
         self.role_select = True
 
+        # Set whenever the screen needs redrawing; small changes only push
+        # their rects to the display, everything else flips the whole window
+        self._dirty = True
+        self._full_redraw = True
+        self._dirty_rects = []
+
     def create_layout(self):
         # Compute responsive sizing
         w, h = self.screen.get_size()
@@ -202,32 +269,88 @@ class PygameUI:
         start_x = int((w - (card_w * GRID_COLS + gap * (GRID_COLS - 1))) / 2)
         start_y = int(h * 0.18)
 
-        self.cards = []
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                idx = r * GRID_COLS + c
-                word = self.game.words[idx]
-                role = self.game.get_card_type(word)
-                x = start_x + c * (card_w + gap)
-                y = start_y + r * (card_h + gap)
-                rect = (x, y, card_w, card_h)
-                self.cards.append(CardView(word, rect, role))
+        # Cached card faces are sized for the old layout
+        _CARD_SURF_CACHE.clear()
+
+        # A resize keeps the existing cards (and their revealed/selected
+        # state) and just moves them; there are none until the board loads
+        if self.game is None:
+            self.cards = []
+            self._animating = set()
+        elif [card.word for card in self.cards] != self.game.words:
+            self.cards = [CardView(word, (0, 0, card_w, card_h), self.game.get_card_type(word))
+                          for word in self.game.words]
+            self._animating = set()  # cards whose reveal animation is running
+        self._hover_card = None  # the one card under the mouse, if any
+        for idx, card in enumerate(self.cards):
+            r, c = divmod(idx, GRID_COLS)
+            x = start_x + c * (card_w + gap)
+            y = start_y + r * (card_h + gap)
+            card.base_rect = pygame.Rect(x, y, card_w, card_h)
+            card.rect = pygame.Rect(card.base_rect)
+            card.hovered = False
+            card.prerender_text(self.fonts['card'])
+        # Hit testing runs over this list with Rect.collidelist
+        self._card_rects = [card.rect for card in self.cards]
 
         # Input area rect
         self.input_rect = pygame.Rect(int(w*0.12), int(h*0.82), int(w*0.76), int(h*0.12))
 
+        # Overlay backgrounds sized to the window
+        self._dims = {}
+        for alpha in (DIM_POPUP, DIM_CONFIRM, DIM_ROLE_SELECT, DIM_HELP):
+            if alpha not in self._dims:
+                self._dims[alpha] = self._make_dim((w, h), alpha)
+        self._popup_strip = self._make_dim((w, 60), DIM_POPUP)
+
+    @staticmethod
+    def _make_dim(size, alpha):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill((0, 0, 0, alpha))
+        return surf.convert_alpha()
+
+    def invalidate(self, rect=None):
+        """Mark rect (or the whole window if None) as needing a redraw."""
+        self._dirty = True
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def popup_rect(self):
+        w, h = self.screen.get_size()
+        return pygame.Rect(0, int(h*0.7), w, 60)
+
     def show_message(self, text, duration=2.0):
         self.message_popup = (text, time.time() + duration)
+        self.invalidate(self.popup_rect())
+
+    def _bg_init_game(self):
+        """Build the game board off the main thread; update() picks it up."""
+        game = codenames.CodenamesGame()
+        game.setup_board()
+        self._game_queue.put(game)
 
     def toggle_role(self, spymaster: bool, team: str = 'RED'):
+        if self.game is None:
+            # Apply the choice once the board has loaded
+            self._pending_role = (spymaster, team)
+            self.invalidate()
+            return
         self.mode_spymaster = spymaster
         self.player_team = team
         self.role_select = False
+        self.invalidate()
 
     def run(self):
         running = True
+        drew = False  # whether the last pass redrew; animations and hover keep it set
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.clock.tick(FPS if drew else IDLE_FPS) / 1000.0
+            # Hover only cares about the latest mouse position
+            moves = pygame.event.get(pygame.MOUSEMOTION)
+            if moves:
+                self.handle_mouse_motion(moves[-1].pos)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -235,22 +358,47 @@ class PygameUI:
                     self.width, self.height = event.w, event.h
                     self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
                     self.create_layout()
-                elif event.type == pygame.MOUSEMOTION:
-                    self.handle_mouse_motion(event.pos)
+                    self.invalidate()
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.invalidate()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.handle_mouse_down(event)
                 elif event.type == pygame.KEYDOWN:
                     self.handle_key(event)
 
             self.update(dt)
+            drew = self._dirty
+            if not drew:
+                continue
             self.draw()
-            pygame.display.flip()
+            if self._full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._dirty_rects)
+            self._dirty = False
+            self._full_redraw = False
+            self._dirty_rects.clear()
 
         pygame.quit()
 
+    def card_at(self, pos):
+        """Return the unrevealed card under pos, or None."""
+        idx = pygame.Rect(pos, (1, 1)).collidelist(self._card_rects)
+        if idx == -1 or self.cards[idx].revealed:
+            return None
+        return self.cards[idx]
+
     def handle_mouse_motion(self, pos):
-        for card in self.cards:
-            card.hovered = card.rect.collidepoint(pos) and (not card.revealed)
+        hit = self.card_at(pos)
+        # Cards don't overlap, so only the old and new hover target change
+        if hit is not self._hover_card:
+            if self._hover_card is not None:
+                self._hover_card.hovered = False
+                self.invalidate(self._hover_card.rect)
+            if hit is not None:
+                hit.hovered = True
+                self.invalidate(hit.rect)
+            self._hover_card = hit
 
     def handle_mouse_down(self, event):
         pos = event.pos
@@ -271,22 +419,25 @@ class PygameUI:
             return
 
         # If clicking on a card
-        for card in self.cards:
-            if card.rect.collidepoint(pos) and not card.revealed:
-                if self.mode_spymaster:
-                    # Spymaster hover shows tooltip only; no click action
-                    self.show_message(card.role, 1.2)
-                else:
-                    # Operative: select/deselect
-                    card.selected = not card.selected
-                    if card.selected:
-                        self.selected_card = card
-                    else:
-                        if self.selected_card == card:
-                            self.selected_card = None
-                return
+        card = self.card_at(pos)
+        if card is None:
+            return
+        if self.mode_spymaster:
+            # Spymaster hover shows tooltip only; no click action
+            self.show_message(card.role, 1.2)
+        else:
+            # Operative: select/deselect
+            card.selected = not card.selected
+            self.invalidate(card.rect)
+            if card.selected:
+                self.selected_card = card
+            else:
+                if self.selected_card == card:
+                    self.selected_card = None
 
     def handle_key(self, event):
+        # Keys open/close overlays or change selections; redraw everything
+        self.invalidate()
         # Global shortcuts
         if event.key == pygame.K_q:
             pygame.event.post(pygame.event.Event(pygame.QUIT))
@@ -318,9 +469,24 @@ class PygameUI:
                 self.show_message('Clue submitted', 1.2)
 
     def update(self, dt):
-        # Update cards
-        for card in self.cards:
-            card.update(dt)
+        # Pick up the board once the background setup is done
+        if self.game is None:
+            try:
+                self.game = self._game_queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self.create_layout()
+                self.invalidate()
+                if self._pending_role:
+                    self.toggle_role(*self._pending_role)
+
+        # Advance only the cards that are still animating
+        for card in list(self._animating):
+            if card.update(dt):
+                self.invalidate(card.rect)
+            else:
+                self._animating.discard(card)
 
         # Handle confirmation overlay actions (auto-execute for demo after 0.1s)
         if self.confirm_overlay:
@@ -334,10 +500,13 @@ class PygameUI:
         # Popups expire
         if self.message_popup[0] and time.time() > self.message_popup[1]:
             self.message_popup = (None, 0)
+            self.invalidate(self.popup_rect())
 
     def reveal_card(self, card: CardView):
         card.revealed = True
         card.selected = False
+        self._animating.add(card)
+        self.invalidate(card.rect)
         self.show_message(f'{card.word} revealed ({card.role})', 1.5)
 
     def draw(self):
@@ -345,13 +514,11 @@ class PygameUI:
         self.screen.fill(COL_BOARD_BG)
 
         # Title
-        title_surf = self.fonts['title'].render('Codenames', True, COL_WHITE)
-        self.screen.blit(title_surf, (20, 10))
+        self.screen.blit(self._title_surf, (20, 10))
 
         # Team / Turn indicator
-        turn_text = f"{self.game.turn} Team Turn"
-        sub_surf = self.fonts['sub'].render(turn_text, True, COL_WHITE)
-        self.screen.blit(sub_surf, (20, 56))
+        if self.game is not None:
+            self.screen.blit(self._render_sub(f"{self.game.turn} Team Turn"), (20, 56))
 
         # Cards
         for card in self.cards:
@@ -359,9 +526,7 @@ class PygameUI:
 
         # Input area (bottom)
         pygame.draw.rect(self.screen, COL_BEIGE, self.input_rect, border_radius=10)
-        hint = 'Spymaster: Enter "Clue Number" | Operative: Click a card and press Space to confirm'
-        hint_surf = self.fonts['input'].render(hint, True, COL_TEXT_DARK)
-        self.screen.blit(hint_surf, (self.input_rect.x + 12, self.input_rect.y + 12))
+        self.screen.blit(self._hint_surf, (self.input_rect.x + 12, self.input_rect.y + 12))
 
         # Role selection overlay
         if self.role_select:
@@ -379,73 +544,63 @@ class PygameUI:
         if self.confirm_overlay:
             self.draw_confirm_overlay(self.confirm_overlay[1])
 
+    def _render_sub(self, text):
+        """Render a line in the subtitle font; there are only a few turn strings."""
+        surf = self._sub_cache.get(text)
+        if surf is None:
+            surf = self._sub_cache[text] = self.fonts['sub'].render(text, True, COL_WHITE)
+        return surf
+
     def draw_popup(self, text):
-        w, h = self.screen.get_size()
-        surf = pygame.Surface((w, 60), pygame.SRCALPHA)
-        surf.fill((0,0,0,160))
-        txt = self.fonts['sub'].render(text, True, COL_WHITE)
-        surf.blit(txt, (10, 12))
-        self.screen.blit(surf, (0, int(h*0.7)))
+        if self._popup_text[0] != text:
+            self._popup_text = (text, self.fonts['sub'].render(text, True, COL_WHITE))
+        y = self.popup_rect().y
+        self.screen.blit(self._popup_strip, (0, y))
+        self.screen.blit(self._popup_text[1], (10, y + 12))
 
     def draw_confirm_overlay(self, card: CardView):
         w, h = self.screen.get_size()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0,0))
+        self.screen.blit(self._dims[DIM_CONFIRM], (0,0))
 
-        txt = self.fonts['title'].render(f'Confirm guess: {card.word}?', True, COL_WHITE)
-        rect = txt.get_rect(center=(w//2, h//2 - 20))
-        self.screen.blit(txt, rect)
+        title_ft = self.fonts['title_ft']
+        text = f'Confirm guess: {card.word}?'
+        rect = title_ft.get_rect(text)
+        rect.center = (w//2, h//2 - 20)
+        title_ft.render_to(self.screen, rect, text, fgcolor=COL_WHITE)
 
-        sub = self.fonts['sub'].render('Press Space to confirm, Esc to cancel', True, COL_WHITE)
+        sub = self._confirm_hint_surf
         subr = sub.get_rect(center=(w//2, h//2 + 30))
         self.screen.blit(sub, subr)
 
     def draw_help_overlay(self):
-        w, h = self.screen.get_size()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0,0))
-        lines = [
-            'Help - Controls',
-            'Mouse: Hover to highlight, click to select/deselect (Operative)',
-            'Space: Confirm selected card (Operative)',
-            'Enter: Submit clue (Spymaster)',
-            'Esc: Clear selection / close overlays',
-            'F1: Toggle this help',
-            'Q: Quit'
-        ]
+        self.screen.blit(self._dims[DIM_HELP], (0,0))
         y = 80
-        for i, line in enumerate(lines):
-            font = self.fonts['title'] if i==0 else self.fonts['sub']
-            surf = font.render(line, True, COL_WHITE)
+        for surf in self._help_surfs:
             self.screen.blit(surf, (60, y))
             y += 50
 
     def draw_role_select(self):
         w, h = self.screen.get_size()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0,0))
+        self.screen.blit(self._dims[DIM_ROLE_SELECT], (0,0))
 
-        title = self.fonts['title'].render('Choose Role & Team', True, COL_WHITE)
+        title, txt, txt2, txt3 = self._role_surfs
         self.screen.blit(title, (int(w*0.3), int(h*0.2)))
 
         # Buttons
         bx = int(w*0.3); by = int(h*0.35); bw = 160; bh = 60
         # Spymaster (Red)
         pygame.draw.rect(self.screen, COL_RED, (bx, by, bw, bh), border_radius=8)
-        txt = self.fonts['sub'].render('Spymaster (Red)', True, COL_WHITE)
         self.screen.blit(txt, (bx+12, by+16))
         # Operative (Red)
         pygame.draw.rect(self.screen, COL_BEIGE, (bx+220, by, bw, bh), border_radius=8)
-        txt2 = self.fonts['sub'].render('Operative (Red)', True, COL_TEXT_DARK)
         self.screen.blit(txt2, (bx+232, by+16))
         # Operative (Blue)
         pygame.draw.rect(self.screen, COL_BEIGE, (bx+440, by, bw, bh), border_radius=8)
-        txt3 = self.fonts['sub'].render('Operative (Blue)', True, COL_TEXT_DARK)
         self.screen.blit(txt3, (bx+452, by+16))
 
+        if self.game is None:
+            self.screen.blit(self._loading_surf, (bx, by + bh + 30))
+
 
 if __name__ == '__main__':
     ui = PygameUI()
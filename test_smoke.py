@@ -19,6 +19,15 @@ try:
     gu = Guesser(team)
     guess = gu.make_guess(g, clue, count)
     print('AIGuesser selected:', guess)
+
+    # Seeded simulations are reproducible and play like the CLI's AI vs AI mode
+    counts = game_mod.simulate_batch(20, seed=7)
+    assert counts == game_mod.simulate_batch(20, seed=7), 'simulate_batch(seed=7) differs between runs'
+    for s in range(1, 6):
+        cli_winner = game_mod.play_game(verbose=False, seed=s, mode=1)
+        sim_winner = game_mod.simulate_game(s)
+        assert sim_winner == cli_winner, f'seed {s}: simulate_game {sim_winner} != play_game {cli_winner}'
+    print('Seeded simulations:', dict(counts))
     print('Smoke test: OK')
 except Exception:
     traceback.print_exc()
@@ -0,0 +1,151 @@
+"""
+Codenames AI Game - Translation
+Language table and translator backends shared by the GUI and build_translations.py.
+Needs 'requests' (MyMemory API) or 'googletrans'; neither is imported until a
+translator is created.
+"""
+
+import importlib.util
+import os
+from types import SimpleNamespace
+
+# Translation support: the MyMemory API via requests, falling back to
+# googletrans; both are only imported once translation is used
+MYMEMORY_AVAILABLE = importlib.util.find_spec('requests') is not None
+GOOGLETRANS_AVAILABLE = importlib.util.find_spec('googletrans') is not None
+TRANSLATION_AVAILABLE = MYMEMORY_AVAILABLE or GOOGLETRANS_AVAILABLE
+
+# Common languages for translation
+COMMON_LANGUAGES = {
+    'Chinese (Simplified)': 'zh-cn',
+    'Chinese (Traditional)': 'zh-tw',
+    'Spanish': 'es',
+    'French': 'fr',
+    'German': 'de',
+    'Japanese': 'ja',
+    'Korean': 'ko',
+    'Italian': 'it',
+    'Portuguese': 'pt',
+    'Russian': 'ru',
+    'Arabic': 'ar',
+    'Hindi': 'hi',
+    'Thai': 'th',
+    'Vietnamese': 'vi',
+    'Indonesian': 'id',
+    'Turkish': 'tr',
+    'Dutch': 'nl',
+    'Polish': 'pl',
+    'Greek': 'el',
+    'Czech': 'cs'
+}
+
+# Seconds before a translation request is abandoned
+TRANSLATION_TIMEOUT = 5.0
+MYMEMORY_URL = 'https://api.mymemory.translated.net/get'
+MYMEMORY_MAX_QUERY = 500  # bytes of text MyMemory accepts per request
+
+# Optional pre-built WORD_POOL translations ({lang: {word: translated}}). Not
+# shipped with the game; generate it with build_translations.py so board words
+# no longer need a network lookup
+STATIC_TRANSLATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translations.json')
+
+
+class TranslatorBackend:
+    """MyMemory client with googletrans' translate(texts, dest) interface.
+
+    Words are sent newline-joined, as many per request as fit in
+    MYMEMORY_MAX_QUERY bytes, so a board costs one request rather than one
+    per word (MyMemory's anonymous quota is per request). One
+    requests.Session is kept for the whole session so every request reuses
+    the same keep-alive connection. After the first failed request the rest
+    of the batch skips MyMemory, so a dead connection costs one timeout.
+    Words without a result are retried with the fallback translator
+    (googletrans) if one is given.
+
+    Words that still have no translation come back as None; an exception is
+    only raised if nothing could be translated.
+    """
+
+    def __init__(self, fallback=None):
+        import requests
+        self.session = requests.Session()
+        self.fallback = fallback
+
+    def translate(self, texts, dest: str):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        results = [None] * len(batch)
+        error = None
+        for chunk in self._chunks(batch):
+            if error is not None:
+                break
+            try:
+                lines = self._translate_lines([batch[i] for i in chunk], dest)
+            except Exception as e:
+                error = e
+                continue
+            for i, line in zip(chunk, lines):
+                results[i] = SimpleNamespace(text=line)
+
+        failed = [i for i, result in enumerate(results) if result is None]
+        if failed and self.fallback is not None:
+            try:
+                retried = self.fallback.translate([batch[i] for i in failed], dest=dest)
+            except Exception as e:
+                error = e
+            else:
+                for i, result in zip(failed, retried):
+                    results[i] = result
+        if all(result is None for result in results):
+            raise error or RuntimeError('MyMemory returned no translations')
+        return results[0] if single else results
+
+    @staticmethod
+    def _chunks(batch):
+        """Split batch indexes into groups whose joined query fits one request."""
+        chunk, size = [], 0
+        for i, text in enumerate(batch):
+            length = len(text.encode('utf-8')) + 1  # plus the newline
+            if chunk and size + length > MYMEMORY_MAX_QUERY:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(i)
+            size += length
+        if chunk:
+            yield chunk
+
+    def _translate_lines(self, texts, dest: str):
+        """Translate texts in one request; a garbled line count gives no results."""
+        # MyMemory wants region codes upper-cased (zh-cn -> zh-CN)
+        lang, _, region = dest.partition('-')
+        target = f"{lang}-{region.upper()}" if region else lang
+        response = self.session.get(
+            MYMEMORY_URL,
+            params={'q': '\n'.join(texts), 'langpair': f'en|{target}'},
+            timeout=TRANSLATION_TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.json()
+        if str(data.get('responseStatus')) != '200':
+            raise RuntimeError(data.get('responseDetails') or 'MyMemory request failed')
+        lines = [line.strip() for line in data['responseData']['translatedText'].splitlines()]
+        return lines if len(lines) == len(texts) else []
+
+
+def create_translator():
+    """Create a translator: MyMemory, backed by googletrans if installed.
+
+    Keep the instance around so its HTTP client (and the open connection)
+    is reused by every request. Raises ImportError if neither backend is
+    installed.
+    """
+    google = None
+    try:
+        from googletrans import Translator
+        google = Translator(timeout=TRANSLATION_TIMEOUT)
+    except ImportError:
+        if not MYMEMORY_AVAILABLE:
+            raise
+    if MYMEMORY_AVAILABLE:
+        return TranslatorBackend(fallback=google)
+    return google